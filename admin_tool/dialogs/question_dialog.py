@@ -3,36 +3,38 @@ Question Dialog - Create/Edit questions
 Version: 3.3 - Added Dropdown support
 """
 
+import traceback
 import tkinter as tk
 from tkinter import ttk, messagebox
-import os
-import sys
 
-# Add path for imports if needed
-if os.path.dirname(os.path.abspath(__file__)) not in sys.path:
-    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-
-from shared.models import *
-from shared.constants import QUESTION_TYPES, QUESTION_TYPE_NAMES, OTHERS_CATEGORY
-
-# Import all modular forms
-from admin_tool.dialogs.question_forms import (
-    MultipleChoiceForm,
-    MultipleChoiceMultipleForm,
-    TrueFalseForm,
-    FillInBlankForm,
-    DropdownForm,
-    MatchingForm,
-    ReorderingForm,
-    ReadingComprehensionForm
+from shared.models import (
+    MultipleChoiceQuestion,
+    MultipleChoiceMultipleQuestion,
+    TrueFalseQuestion,
+    FillInBlankQuestion,
+    DropdownQuestion,
+    MatchingQuestion,
+    ReorderingQuestion,
+    ReadingComprehensionQuestion
 )
+from shared.constants import QUESTION_TYPES, OTHERS_CATEGORY
+from shared.data_manager import DataManager
+
+# Form modules are imported lazily - see FORM_REGISTRY
+from admin_tool.dialogs import question_forms
 
-# Import image helper for save operations
-try:
-    from utils.image_helper import copy_image_to_subject, validate_scale, DEFAULT_SCALE
-    IMAGE_HELPER_AVAILABLE = True
-except ImportError:
-    IMAGE_HELPER_AVAILABLE = False
+# Question type -> (form class name, model class)
+# Form classes are looked up on question_forms when first shown
+FORM_REGISTRY = {
+    'multiple_choice': ('MultipleChoiceForm', MultipleChoiceQuestion),
+    'multiple_choice_multiple': ('MultipleChoiceMultipleForm', MultipleChoiceMultipleQuestion),
+    'true_false': ('TrueFalseForm', TrueFalseQuestion),
+    'fill_in_blank': ('FillInBlankForm', FillInBlankQuestion),
+    'dropdown': ('DropdownForm', DropdownQuestion),
+    'matching': ('MatchingForm', MatchingQuestion),
+    'reordering': ('ReorderingForm', ReorderingQuestion),
+    'reading_comprehension': ('ReadingComprehensionForm', ReadingComprehensionQuestion)
+}
 
 
 class QuestionDialog:
@@ -53,11 +55,12 @@ class QuestionDialog:
         self.callback = callback
         self.parent_app = parent_app
         
-        self.original_type = question.type if question else None
-        self.original_data = {}
-        
         # Current form instance
         self.current_form = None
+        # Forms built so far, kept hidden while another type is shown
+        # {qtype: (frame, form)}
+        self._form_frames = {}
+        self._active_type = None
         
         self.dialog = tk.Toplevel(parent)
         self.dialog.title(f"{mode.capitalize()} Question")
@@ -82,6 +85,7 @@ class QuestionDialog:
     def on_close(self):
         if self.parent_app:
             self.parent_app.dialog_open = False
+        self._cleanup()
         self.dialog.destroy()
     
     def setup_ui(self):
@@ -93,10 +97,8 @@ class QuestionDialog:
         ttk.Label(lesson_frame, text="Assign to Lesson:", 
                  font=('', 10, 'bold')).pack(side=tk.LEFT, padx=5)
         
-        # Build lesson options
-        lesson_names = [OTHERS_CATEGORY] + [l.name for l in self.subject.lessons]
-        lesson_ids = [None] + [l.id for l in self.subject.lessons]
-        self.lesson_mapping = dict(zip(lesson_names, lesson_ids))
+        # Lesson options (cached on the subject)
+        lesson_names, self.lesson_mapping = self.subject.get_lesson_choices()
         
         self.lesson_var = tk.StringVar()
         self.lesson_combo = ttk.Combobox(lesson_frame, textvariable=self.lesson_var,
@@ -129,18 +131,22 @@ class QuestionDialog:
         canvas_frame = ttk.Frame(self.dialog)
         canvas_frame.pack(fill=tk.BOTH, expand=True, padx=10, pady=5)
         
-        canvas = tk.Canvas(canvas_frame, highlightthickness=0)
+        canvas = self._canvas = tk.Canvas(canvas_frame, highlightthickness=0)
         scrollbar = ttk.Scrollbar(canvas_frame, orient="vertical", command=canvas.yview)
         self.content_frame = ttk.Frame(canvas)
         
-        canvas.create_window((0, 0), window=self.content_frame, anchor='nw')
+        # One window item for the dialog's lifetime; forms swap inside content_frame
+        self._window_id = canvas.create_window((0, 0), window=self.content_frame, anchor='nw')
         canvas.configure(yscrollcommand=scrollbar.set)
         
         canvas.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
         scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
         
-        # Update scroll region when content changes
-        self.content_frame.bind('<Configure>', lambda e: canvas.configure(scrollregion=canvas.bbox('all')))
+        # Update scroll region when content changes (coalesced - see _schedule_scroll_update)
+        self._scroll_pending = None
+        self.content_frame.bind('<Configure>', self._schedule_scroll_update)
+        # Keep the form as wide as the visible canvas
+        canvas.bind('<Configure>', self._on_canvas_resize)
         
         self.update_form()
         
@@ -151,124 +157,79 @@ class QuestionDialog:
         ttk.Button(btn_frame, text="Save", command=self.save, width=15).pack(side=tk.LEFT, padx=5)
         ttk.Button(btn_frame, text="Cancel", command=self.on_close, width=15).pack(side=tk.LEFT, padx=5)
     
+    def _schedule_scroll_update(self, event=None):
+        """Recompute the scroll region once Tk is idle, however many resizes arrive first"""
+        if self._scroll_pending is None:
+            self._scroll_pending = self.dialog.after_idle(self._update_scroll_region)
+    
+    def _update_scroll_region(self):
+        """Fit the canvas scroll region to the current form"""
+        self._scroll_pending = None
+        self._canvas.configure(scrollregion=self._canvas.bbox('all'))
+    
+    def _on_canvas_resize(self, event):
+        """Stretch the content window to the canvas width"""
+        self._canvas.itemconfigure(self._window_id, width=event.width)
+    
     def on_type_change(self, event=None):
-        """Handle question type change"""
-        if self.original_type:
-            self.save_current_form_data()
-        
+        """Handle question type change (pooled forms keep their own input)"""
         self.update_form()
     
-    def save_current_form_data(self):
-        """Save current form data before type change"""
-        if self.current_form:
-            data = self.current_form.collect_data()
-            if data:
-                self.original_data = data
-    
     def update_form(self):
-        """Update form based on question type"""
-        # Clear previous form
-        for widget in self.content_frame.winfo_children():
-            widget.destroy()
-        
-        # Clean up previous form instance
-        if self.current_form:
-            self.current_form.cleanup()
-            self.current_form = None
-        
+        """Show the form for the selected question type (built on first use)"""
         qtype = self.type_var.get()
+        if qtype == self._active_type:
+            return
         
-        # Create appropriate form based on type
-        if qtype == "multiple_choice":
-            self.current_form = MultipleChoiceForm(
-                self.content_frame, self.subject, self.lesson_id, self.mode,
-                self.question if self.mode == "edit" and isinstance(self.question, MultipleChoiceQuestion) else None
-            )
-        
-        elif qtype == "multiple_choice_multiple":
-            self.current_form = MultipleChoiceMultipleForm(
-                self.content_frame, self.subject, self.lesson_id, self.mode,
-                self.question if self.mode == "edit" and isinstance(self.question, MultipleChoiceMultipleQuestion) else None
-            )
-        
-        elif qtype == "true_false":
-            self.current_form = TrueFalseForm(
-                self.content_frame, self.subject, self.lesson_id, self.mode,
-                self.question if self.mode == "edit" and isinstance(self.question, TrueFalseQuestion) else None
-            )
-        
-        elif qtype == "fill_in_blank":
-            self.current_form = FillInBlankForm(
-                self.content_frame, self.subject, self.lesson_id, self.mode,
-                self.question if self.mode == "edit" and isinstance(self.question, FillInBlankQuestion) else None
-            )
-        
-        elif qtype == "dropdown":  # NEW
-            self.current_form = DropdownForm(
-                self.content_frame, self.subject, self.lesson_id, self.mode,
-                self.question if self.mode == "edit" and isinstance(self.question, DropdownQuestion) else None
-            )
-        
-        elif qtype == "matching":
-            self.current_form = MatchingForm(
-                self.content_frame, self.subject, self.lesson_id, self.mode,
-                self.question if self.mode == "edit" and isinstance(self.question, MatchingQuestion) else None
-            )
+        entry = FORM_REGISTRY.get(qtype)
+        if entry is None:
+            return
         
-        elif qtype == "reordering":
-            self.current_form = ReorderingForm(
-                self.content_frame, self.subject, self.lesson_id, self.mode,
-                self.question if self.mode == "edit" and isinstance(self.question, ReorderingQuestion) else None
-            )
+        # Hide the previous form - it keeps its widgets and input for switching back
+        if self._active_type is not None:
+            self._form_frames[self._active_type][0].pack_forget()
         
-        elif qtype == "reading_comprehension":
-            self.current_form = ReadingComprehensionForm(
-                self.content_frame, self.subject, self.lesson_id, self.mode,
-                self.question if self.mode == "edit" and isinstance(self.question, ReadingComprehensionQuestion) else None
-            )
+        pooled = self._form_frames.get(qtype)
+        if pooled is None:
+            form_name, model_cls = entry
+            form_cls = getattr(question_forms, form_name)
+            
+            # Only hand the question to the form if it is already of this type
+            question = self.question if self.mode == "edit" and type(self.question) is model_cls else None
+            frame = ttk.Frame(self.content_frame)
+            pooled = (frame, form_cls(frame, self.subject, self.lesson_id, self.mode, question))
+            self._form_frames[qtype] = pooled
+        
+        frame, self.current_form = pooled
+        self._active_type = qtype
+        frame.pack(fill=tk.BOTH, expand=True)
+    
+    def _cleanup(self):
+        """Release forms and pending callbacks before the dialog is destroyed"""
+        if self._scroll_pending is not None:
+            self.dialog.after_cancel(self._scroll_pending)
+            self._scroll_pending = None
+        for _, form in self._form_frames.values():
+            form.cleanup()
+        self._form_frames.clear()
     
     def get_selected_lesson_id(self):
         """Get the lesson ID selected in the lesson dropdown"""
         selected_name = self.lesson_var.get()
         return self.lesson_mapping.get(selected_name)
     
-    def _attach_question_image(self, question, question_id, data):
-        """
-        Global helper to attach question image to any question type.
-        """
-        if 'questionImage' not in data:
-            return question
-        
-        img_path = data['questionImage']
-        
-        if img_path.startswith('images/'):
-            question.questionImage = img_path
-            question.questionImageScale = data.get('questionImageScale', DEFAULT_SCALE)
-        else:
-            rel_path = copy_image_to_subject(img_path, self.subject.name, question_id, 'main')
-            if rel_path:
-                question.questionImage = rel_path
-                question.questionImageScale = validate_scale(
-                    data.get('questionImageScale', DEFAULT_SCALE)
-                )
-        
-        return question
-    
     def save(self):
         """Save question"""
         try:
-            qtype = self.type_var.get()
             question_id = self.question.id if self.mode == "edit" else self.subject.get_next_question_id()
             selected_lesson_id = self.get_selected_lesson_id()
             
-            # Validate
-            is_valid, error = self.current_form.validate()
+            # Validate and collect (forms that parse while validating do it once)
+            is_valid, error, data = self.current_form.validate_and_collect()
             if not is_valid:
                 messagebox.showerror("Validation Error", error)
                 return
             
-            # Collect data
-            data = self.current_form.collect_data()
             if not data:
                 messagebox.showerror("Error", "Failed to collect form data")
                 return
@@ -278,25 +239,16 @@ class QuestionDialog:
                 messagebox.showerror("Validation Error", data['error'])
                 return
             
-            # Create question based on type
-            if qtype == "multiple_choice":
-                new_question = self.create_multiple_choice(question_id, selected_lesson_id, data)
-            elif qtype == "multiple_choice_multiple":
-                new_question = self.create_multiple_choice_multiple(question_id, selected_lesson_id, data)
-            elif qtype == "true_false":
-                new_question = self.create_true_false(question_id, selected_lesson_id, data)
-            elif qtype == "fill_in_blank":
-                new_question = self.create_fill_blank(question_id, selected_lesson_id, data)
-            elif qtype == "dropdown":  # NEW
-                new_question = self.create_dropdown(question_id, selected_lesson_id, data)
-            elif qtype == "matching":
-                new_question = self.create_matching(question_id, selected_lesson_id, data)
-            elif qtype == "reordering":
-                new_question = self.create_reordering(question_id, selected_lesson_id, data)
-            elif qtype == "reading_comprehension":
-                new_question = self.create_reading_comp(question_id, selected_lesson_id, data)
-            else:
-                messagebox.showerror("Error", f"Unknown question type: {qtype}")
+            # Each form builds its own question type
+            new_question = self.current_form.build_question(question_id, selected_lesson_id, data)
+            
+            # Nothing edited - close without rewriting the subject file
+            # (dataclass equality compares every persisted field)
+            if self.mode == "edit" and new_question == self.question:
+                if self.parent_app:
+                    self.parent_app.dialog_open = False
+                self._cleanup()
+                self.dialog.destroy()
                 return
             
             # Save to subject
@@ -306,11 +258,11 @@ class QuestionDialog:
                 self.subject.update_question(question_id, new_question)
             
             # Save subject to file
-            from shared.data_manager import DataManager
             if DataManager.save_subject(self.subject):
                 if self.parent_app:
                     self.parent_app.dialog_open = False
                 
+                self._cleanup()
                 self.dialog.destroy()
                 
                 if self.callback:
@@ -321,138 +273,6 @@ class QuestionDialog:
                 messagebox.showerror("Error", "Failed to save question")
         
         except Exception as e:
-            import traceback
+            # Tk swallows callback exceptions - report it to the user instead
             traceback.print_exc()
             messagebox.showerror("Error", f"Save failed: {str(e)}")
-    
-    def create_multiple_choice(self, question_id, lesson_id, data):
-        """Create Multiple Choice question from data"""
-        new_question = MultipleChoiceQuestion(
-            id=question_id,
-            type='multiple_choice',
-            lessonId=lesson_id,
-            question=data['question'],
-            options=data['options'],
-            correct=data['correct']
-        )
-        
-        # Handle question image
-        if 'questionImage' in data:
-            new_question.questionImage = data['questionImage']
-            new_question.questionImageScale = data.get('questionImageScale', DEFAULT_SCALE)
-        
-        # Handle option images
-        if data.get('use_option_images'):
-            option_images = {}
-            for i, img_path in data.get('option_images_temp', {}).items():
-                if img_path.startswith('images/'):
-                    option_images[str(i)] = img_path
-                else:
-                    rel_path = copy_image_to_subject(img_path, self.subject.name, question_id, f'option_{i}')
-                    if rel_path:
-                        option_images[str(i)] = rel_path
-            
-            new_question.optionImages = option_images
-            new_question.optionImageScale = data.get('option_scale', DEFAULT_SCALE)
-        
-        return new_question
-    
-    def create_multiple_choice_multiple(self, question_id, lesson_id, data):
-        """Create Multiple Choice Multiple question from data"""
-        new_question = MultipleChoiceMultipleQuestion(
-            id=question_id,
-            type='multiple_choice_multiple',
-            lessonId=lesson_id,
-            question=data['question'],
-            options=data['options'],
-            correct=data['correct']  # This is a LIST of indices
-        )
-        
-        # Handle question image
-        if 'questionImage' in data:
-            new_question.questionImage = data['questionImage']
-            new_question.questionImageScale = data.get('questionImageScale', DEFAULT_SCALE)
-        
-        # Handle option images
-        if data.get('use_option_images'):
-            option_images = {}
-            for i, img_path in data.get('option_images_temp', {}).items():
-                if img_path.startswith('images/'):
-                    option_images[str(i)] = img_path
-                else:
-                    rel_path = copy_image_to_subject(img_path, self.subject.name, question_id, f'option_{i}')
-                    if rel_path:
-                        option_images[str(i)] = rel_path
-            
-            new_question.optionImages = option_images
-            new_question.optionImageScale = data.get('option_scale', DEFAULT_SCALE)
-        
-        return new_question
-    
-    def create_true_false(self, question_id, lesson_id, data):
-        """Create True/False question from data"""
-        new_question = TrueFalseQuestion(
-            id=question_id,
-            type='true_false',
-            lessonId=lesson_id,
-            question=data['question'],
-            correct=data['correct']
-        )
-        return self._attach_question_image(new_question, question_id, data)
-    
-    def create_fill_blank(self, question_id, lesson_id, data):
-        """Create Fill in Blank question from data"""
-        new_question = FillInBlankQuestion(
-            id=question_id,
-            type='fill_in_blank',
-            lessonId=lesson_id,
-            question=data['question'],
-            correct=data['answers']
-        )
-        return self._attach_question_image(new_question, question_id, data)
-    
-    def create_dropdown(self, question_id, lesson_id, data):
-        """Create Dropdown question from data"""
-        new_question = DropdownQuestion(
-            id=question_id,
-            type='dropdown',
-            lessonId=lesson_id,
-            question=data['question'],
-            dropdowns=data['dropdowns']
-        )
-        return self._attach_question_image(new_question, question_id, data)
-    
-    def create_matching(self, question_id, lesson_id, data):
-        """Create Matching question from data"""
-        new_question = MatchingQuestion(
-            id=question_id,
-            type='matching',
-            lessonId=lesson_id,
-            question=data['question'],
-            pairs=data['pairs'],
-            correct=data['correct']
-        )
-        return self._attach_question_image(new_question, question_id, data)
-    
-    def create_reordering(self, question_id, lesson_id, data):
-        """Create Reordering question from data"""
-        new_question = ReorderingQuestion(
-            id=question_id,
-            type='reordering',
-            lessonId=lesson_id,
-            question=data['question'],
-            items=data['items']
-        )
-        return self._attach_question_image(new_question, question_id, data)
-    
-    def create_reading_comp(self, question_id, lesson_id, data):
-        """Create Reading Comprehension question from data"""
-        new_question = ReadingComprehensionQuestion(
-            id=question_id,
-            type='reading_comprehension',
-            lessonId=lesson_id,
-            passage=data['passage'],
-            passageId=f"passage_{question_id}",
-            questions=data['sub_questions']
-        )
-        return self._attach_question_image(new_question, question_id, data)
@@ -1,27 +1,39 @@
 """
 Question Forms Package
 Modular question type form implementations
-Version: 2.3 - Added DropdownForm
+Version: 2.4 - Form modules are imported lazily on first use
 """
 
-from .base_form import BaseQuestionForm
-from .multiple_choice_form import MultipleChoiceForm
-from .multiple_choice_multiple_form import MultipleChoiceMultipleForm
-from .true_false_form import TrueFalseForm
-from .fill_blank_form import FillInBlankForm
-from .matching_form import MatchingForm
-from .reordering_form import ReorderingForm
-from .reading_comp_form import ReadingComprehensionForm
-from .dropdown_form import DropdownForm
-
-__all__ = [
-    'BaseQuestionForm',
-    'MultipleChoiceForm',
-    'MultipleChoiceMultipleForm',
-    'TrueFalseForm',
-    'FillInBlankForm',
-    'MatchingForm',
-    'ReorderingForm',
-    'ReadingComprehensionForm',
-    'DropdownForm',
-]
+import importlib
+
+# Form class name -> module that defines it (imported on first attribute access)
+_LAZY = {
+    'BaseQuestionForm': 'base_form',
+    'MultipleChoiceForm': 'multiple_choice_form',
+    'MultipleChoiceMultipleForm': 'multiple_choice_multiple_form',
+    'TrueFalseForm': 'true_false_form',
+    'FillInBlankForm': 'fill_blank_form',
+    'MatchingForm': 'matching_form',
+    'ReorderingForm': 'reordering_form',
+    'ReadingComprehensionForm': 'reading_comp_form',
+    'DropdownForm': 'dropdown_form',
+}
+
+
+def __getattr__(name):
+    """Import a form's module the first time the form class is requested"""
+    module_name = _LAZY.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    cls = getattr(importlib.import_module(f".{module_name}", __name__), name)
+    # Cache so later lookups skip __getattr__
+    globals()[name] = cls
+    return cls
+
+
+def __dir__():
+    """Include the not-yet-imported form classes"""
+    return sorted(list(globals()) + list(_LAZY))
+
+
+__all__ = list(_LAZY)
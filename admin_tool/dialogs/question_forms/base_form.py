@@ -11,6 +11,13 @@ from typing import Optional, Dict, Any, Tuple
 
 from shared.models import Subject, Question
 
+# Image helper, for attaching a question image when building the question
+try:
+    from utils.image_helper import copy_image_to_subject, validate_scale, DEFAULT_SCALE
+    IMAGE_HELPER_AVAILABLE = True
+except ImportError:
+    IMAGE_HELPER_AVAILABLE = False
+
 
 class BaseQuestionForm(ABC):
     """Abstract base class for question type forms"""
@@ -73,6 +80,88 @@ class BaseQuestionForm(ABC):
         """
         pass
     
+    @abstractmethod
+    def build_question(self, question_id: int, lesson_id: Optional[str],
+                       data: Dict[str, Any]) -> Question:
+        """
+        Build the question model from collected data
+        
+        Args:
+            question_id: ID for the new/edited question
+            lesson_id: Lesson selected in the dialog (None = Others)
+            data: Result of collect_data()
+        
+        Returns:
+            Question object of this form's type
+        """
+        pass
+    
+    def attach_question_image(self, question: Question, question_id: int,
+                              data: Dict[str, Any]) -> Question:
+        """
+        Attach the question image from collected data, copying new files
+        into the subject's images folder
+        
+        Returns:
+            The same question object
+        """
+        if 'questionImage' not in data:
+            return question
+        
+        img_path = data['questionImage']
+        
+        if img_path.startswith('images/'):
+            question.questionImage = img_path
+            question.questionImageScale = data.get('questionImageScale', DEFAULT_SCALE)
+        else:
+            rel_path = copy_image_to_subject(img_path, self.subject.name, question_id, 'main')
+            if rel_path:
+                question.questionImage = rel_path
+                question.questionImageScale = validate_scale(
+                    data.get('questionImageScale', DEFAULT_SCALE)
+                )
+        
+        return question
+    
+    def attach_option_images(self, question: Question, question_id: int,
+                             data: Dict[str, Any]) -> Question:
+        """
+        Attach option images from collected data (image-option mode only),
+        copying new files into the subject's images folder
+        
+        Returns:
+            The same question object
+        """
+        if not data.get('use_option_images'):
+            return question
+        
+        option_images = {}
+        for i, img_path in data.get('option_images_temp', {}).items():
+            if img_path.startswith('images/'):
+                option_images[str(i)] = img_path
+            else:
+                rel_path = copy_image_to_subject(img_path, self.subject.name, question_id, f'option_{i}')
+                if rel_path:
+                    option_images[str(i)] = rel_path
+        
+        question.optionImages = option_images
+        question.optionImageScale = data.get('option_scale', DEFAULT_SCALE)
+        return question
+    
+    def validate_and_collect(self) -> Tuple[bool, str, Optional[Dict[str, Any]]]:
+        """
+        Validate the form and collect its data in one call
+        Forms whose validate() already collects data override this so the
+        form is only parsed once per save
+        
+        Returns:
+            Tuple of (is_valid: bool, error_message: str, data or None if invalid)
+        """
+        is_valid, error = self.validate()
+        if not is_valid:
+            return False, error, None
+        return True, "", self.collect_data()
+    
     def get_lesson_id(self) -> Optional[str]:
         """
         Get the lesson ID for this question
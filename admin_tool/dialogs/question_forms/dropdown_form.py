@@ -25,11 +25,9 @@ from admin_tool.dialogs.question_forms.base_form import BaseQuestionForm
 try:
     from utils.image_helper import (
         select_image_file,
-        copy_image_to_subject,
         create_image_preview,
         get_image_info,
         format_file_size,
-        validate_scale,
         DEFAULT_SCALE
     )
     IMAGE_HELPER_AVAILABLE = True
@@ -284,21 +282,11 @@ class DropdownForm(BaseQuestionForm):
             # Question text
             data['question'] = self.question_text.get('1.0', tk.END).strip()
             
-            # Question image
+            # Question image - new files are copied into the subject folder
+            # by build_question() (attach_question_image), once validation passed
             if 'question' in self.temp_image_paths:
-                img_path = self.temp_image_paths['question']
-                if img_path.startswith('images/'):
-                    data['questionImage'] = img_path
-                    data['questionImageScale'] = self.image_controls['question']['scale_var'].get()
-                else:
-                    q_id = self.question.id if self.question else None
-                    if q_id:
-                        rel_path = copy_image_to_subject(img_path, self.subject.name, q_id, 'main')
-                        if rel_path:
-                            data['questionImage'] = rel_path
-                            data['questionImageScale'] = validate_scale(
-                                self.image_controls['question']['scale_var'].get()
-                            )
+                data['questionImage'] = self.temp_image_paths['question']
+                data['questionImageScale'] = self.image_controls['question']['scale_var'].get()
             
             # Detect dropdowns
             question_text = data['question']
@@ -329,9 +317,14 @@ class DropdownForm(BaseQuestionForm):
     
     def validate(self) -> Tuple[bool, str]:
         """Validate form data"""
+        is_valid, error, _ = self.validate_and_collect()
+        return is_valid, error
+    
+    def validate_and_collect(self) -> Tuple[bool, str, Optional[Dict[str, Any]]]:
+        """Validate form data, returning what was collected so save() can reuse it"""
         data = self.collect_data()
         if not data:
-            return False, "Failed to collect form data"
+            return False, "Failed to collect form data", None
         
         # Use shared validator
         is_valid, error = QuestionValidator.validate_dropdown(
@@ -339,4 +332,15 @@ class DropdownForm(BaseQuestionForm):
             data['dropdowns']
         )
         
-        return is_valid, error
+        return is_valid, error, data if is_valid else None
+    
+    def build_question(self, question_id, lesson_id, data):
+        """Create Dropdown question from data"""
+        new_question = DropdownQuestion(
+            id=question_id,
+            type='dropdown',
+            lessonId=lesson_id,
+            question=data['question'],
+            dropdowns=data['dropdowns']
+        )
+        return self.attach_question_image(new_question, question_id, data)
@@ -7,6 +7,7 @@ Version: 2.0 - Added image support
 import tkinter as tk
 from tkinter import ttk, messagebox
 import os
+import string
 from typing import Optional, Dict, Any, Tuple
 
 from shared.models import Subject, Question, MatchingQuestion
@@ -17,11 +18,9 @@ from admin_tool.dialogs.question_forms.base_form import BaseQuestionForm
 try:
     from utils.image_helper import (
         select_image_file,
-        copy_image_to_subject,
         create_image_preview,
         get_image_info,
         format_file_size,
-        validate_scale,
         DEFAULT_SCALE
     )
     IMAGE_HELPER_AVAILABLE = True
@@ -29,6 +28,9 @@ except ImportError:
     IMAGE_HELPER_AVAILABLE = False
     print("Warning: image_helper not available, image features disabled")
 
+# Pair IDs in order: a, b, c, ... (also caps the number of pairs)
+_PAIR_IDS = string.ascii_lowercase
+
 
 class MatchingForm(BaseQuestionForm):
     """Form for Matching questions"""
@@ -179,48 +181,45 @@ class MatchingForm(BaseQuestionForm):
             # Question text
             data['question'] = self.question_text.get('1.0', tk.END).strip()
             
-            # Question image
+            # Question image - new files are copied into the subject folder
+            # by build_question() (attach_question_image), once validation passed
             if 'question' in self.temp_image_paths:
-                img_path = self.temp_image_paths['question']
-                if img_path.startswith('images/'):
-                    data['questionImage'] = img_path
-                    data['questionImageScale'] = self.image_controls['question']['scale_var'].get()
-                else:
-                    q_id = self.question.id if self.question else None
-                    if q_id:
-                        rel_path = copy_image_to_subject(img_path, self.subject.name, q_id, 'main')
-                        if rel_path:
-                            data['questionImage'] = rel_path
-                            data['questionImageScale'] = validate_scale(
-                                self.image_controls['question']['scale_var'].get()
-                            )
-            
-            # Parse pairs
-            lines = [l.strip() for l in self.pairs_text.get('1.0', tk.END).split('\n') 
-                    if l.strip()]
+                data['questionImage'] = self.temp_image_paths['question']
+                data['questionImageScale'] = self.image_controls['question']['scale_var'].get()
             
+            # Parse pairs (single pass; blank lines are skipped and not counted)
             pairs = []
             correct = {}
             
-            for i, line in enumerate(lines):
-                if ' | ' not in line:
+            i = 0
+            for raw in self.pairs_text.get('1.0', tk.END).split('\n'):
+                line = raw.strip()
+                if not line:
+                    continue
+                
+                left, sep, right = line.partition(' | ')
+                if not sep:
                     data['error'] = f"Line {i+1}: Use format 'Left | Right'"
                     return data
                 
-                parts = line.split(' | ')
-                if len(parts) != 2:
+                if ' | ' in right:
                     data['error'] = f"Line {i+1}: Invalid format"
                     return data
                 
-                left, right = parts[0].strip(), parts[1].strip()
+                left, right = left.strip(), right.strip()
                 
                 if not left or not right:
                     data['error'] = f"Line {i+1}: Both sides must have text"
                     return data
                 
-                pid = chr(97 + i)  # a, b, c, ...
+                if i >= len(_PAIR_IDS):
+                    data['error'] = f"Maximum {len(_PAIR_IDS)} pairs allowed"
+                    return data
+                
+                pid = _PAIR_IDS[i]
                 pairs.append({"country": left, "capital": right, "id": pid})
                 correct[pid] = right
+                i += 1
             
             data['pairs'] = pairs
             data['correct'] = correct
@@ -233,26 +232,39 @@ class MatchingForm(BaseQuestionForm):
     
     def validate(self) -> Tuple[bool, str]:
         """Validate form data"""
-        question_text = self.question_text.get('1.0', tk.END).strip()
-        
-        if not question_text:
-            return False, "Question text is required"
-        
-        # Collect and validate pairs
+        is_valid, error, _ = self.validate_and_collect()
+        return is_valid, error
+    
+    def validate_and_collect(self) -> Tuple[bool, str, Optional[Dict[str, Any]]]:
+        """Validate form data, returning what was collected so save() can reuse it"""
+        # Collect once and validate what was read (no second Text.get round trip)
         data = self.collect_data()
         
         if not data:
-            return False, "Failed to collect form data"
+            return False, "Failed to collect form data", None
+        
+        if not data['question']:
+            return False, "Question text is required", None
         
         if 'error' in data:
-            return False, data['error']
+            return False, data['error'], None
         
         pairs = data.get('pairs', [])
         
+        # (the maximum is enforced by collect_data, which runs out of pair IDs)
         if len(pairs) < 2:
-            return False, "At least 2 pairs are required"
+            return False, "At least 2 pairs are required", None
         
-        if len(pairs) > 26:
-            return False, "Maximum 26 pairs allowed"
-        
-        return True, ""
+        return True, "", data
+    
+    def build_question(self, question_id, lesson_id, data):
+        """Create Matching question from data"""
+        new_question = MatchingQuestion(
+            id=question_id,
+            type='matching',
+            lessonId=lesson_id,
+            question=data['question'],
+            pairs=data['pairs'],
+            correct=data['correct']
+        )
+        return self.attach_question_image(new_question, question_id, data)
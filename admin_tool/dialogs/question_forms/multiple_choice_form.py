@@ -17,11 +17,9 @@ from admin_tool.dialogs.question_forms.base_form import BaseQuestionForm
 try:
     from utils.image_helper import (
         select_image_file,
-        copy_image_to_subject,
         create_image_preview,
         get_image_info,
         format_file_size,
-        validate_scale,
         DEFAULT_SCALE
     )
     IMAGE_HELPER_AVAILABLE = True
@@ -29,6 +27,15 @@ except ImportError:
     IMAGE_HELPER_AVAILABLE = False
     print("Warning: image_helper not available, image features disabled")
 
+# Delay before a scale change redraws the preview, so stepping the
+# spinbox several times only resizes the image once
+_SCALE_DEBOUNCE_MS = 150
+
+# image_controls / temp_image_paths keys of the four option images, by index
+_OPTION_KEYS = tuple(f'option_{i}' for i in range(4))
+# Placeholder option text saved alongside option images
+_DEFAULT_OPTION_LABELS = tuple(f'Option {i}' for i in range(4))
+
 
 class MultipleChoiceForm(BaseQuestionForm):
     """Form for Multiple Choice questions"""
@@ -41,6 +48,8 @@ class MultipleChoiceForm(BaseQuestionForm):
         self.use_option_images_var = tk.BooleanVar(value=False)
         self.saved_text_options = []
         self.saved_image_options = {}
+        # after() id of the pending debounced preview redraw
+        self._scale_after_id = None
         
         # Render and load
         self.render()
@@ -132,16 +141,30 @@ class MultipleChoiceForm(BaseQuestionForm):
         ttk.Spinbox(scale_frame, from_=25, to=200, increment=25,
                    textvariable=self.question_scale_var, width=8).pack(side=tk.LEFT, padx=5)
         ttk.Label(scale_frame, text="%").pack(side=tk.LEFT)
+        self.question_scale_var.trace_add('write', self._schedule_preview_update)
         
         # Preview frame
         self.question_preview_frame = ttk.Frame(img_frame)
         self.question_preview_frame.pack(fill=tk.BOTH, expand=True, padx=5, pady=5)
         
+        # Preview widgets are created once and re-configured on each update
+        self._preview_image_label = tk.Label(self.question_preview_frame)
+        self._preview_info_label = ttk.Label(self.question_preview_frame, font=('', 8), 
+                                             foreground='gray')
+        self._preview_missing_label = ttk.Label(self.question_preview_frame, 
+                                                text="⚠ Image file not found", 
+                                                foreground='orange', font=('', 9))
+        self._preview_widgets = (self._preview_image_label, self._preview_info_label,
+                                 self._preview_missing_label)
+        
         self.image_controls['question'] = {
             'path_var': self.question_img_path_var,
             'scale_var': self.question_scale_var,
             'preview_frame': self.question_preview_frame,
-            'photo_ref': None
+            'photo_ref': None,
+            # Key/info of the preview held in photo_ref
+            'preview_key': None,
+            'info': None
         }
     
     def _add_option_image_control(self, option_index: int):
@@ -161,7 +184,7 @@ class MultipleChoiceForm(BaseQuestionForm):
         ttk.Button(opt_frame, text="✕", width=3,
                   command=lambda idx=option_index: self._remove_option_image(idx)).pack(side=tk.LEFT, padx=2)
         
-        self.image_controls[f'option_{option_index}'] = {
+        self.image_controls[_OPTION_KEYS[option_index]] = {
             'path_var': path_var,
             'photo_ref': None
         }
@@ -181,13 +204,27 @@ class MultipleChoiceForm(BaseQuestionForm):
         self.image_controls['question']['path_var'].set("")
         self._update_question_image_preview()
     
+    def _schedule_preview_update(self, *args):
+        """Redraw the question preview once the scale stops changing"""
+        if self._scale_after_id is not None:
+            self.parent_frame.after_cancel(self._scale_after_id)
+        self._scale_after_id = self.parent_frame.after(_SCALE_DEBOUNCE_MS, self._do_preview_update)
+    
+    def _do_preview_update(self):
+        """Run the debounced preview redraw"""
+        self._scale_after_id = None
+        try:
+            self.question_scale_var.get()
+        except tk.TclError:
+            # Spinbox holds a half-typed value - wait for the next change
+            return
+        self._update_question_image_preview()
+    
     def _update_question_image_preview(self):
         """Update question image preview"""
-        preview_frame = self.image_controls['question']['preview_frame']
-        
-        # Clear preview
-        for widget in preview_frame.winfo_children():
-            widget.destroy()
+        # Hide the preview widgets; whichever apply are re-packed below
+        for widget in self._preview_widgets:
+            widget.pack_forget()
         
         if 'question' not in self.temp_image_paths:
             return
@@ -195,34 +232,44 @@ class MultipleChoiceForm(BaseQuestionForm):
         filepath = self.temp_image_paths['question']
         if not os.path.exists(filepath):
             # Show warning for missing file
-            ttk.Label(preview_frame, text="⚠ Image file not found", 
-                     foreground='orange', font=('', 9)).pack(pady=5)
+            self._preview_missing_label.pack(pady=5)
             return
         
-        scale = self.image_controls['question']['scale_var'].get()
-        photo, w, h = create_image_preview(filepath, max_width=400, scale_percent=scale)
+        controls = self.image_controls['question']
+        scale = controls['scale_var'].get()
+        
+        # Same file at the same scale: reuse the last PhotoImage and info
+        # instead of decoding and resizing again
+        key = (filepath, scale, os.path.getmtime(filepath))
+        if key == controls.get('preview_key'):
+            photo, info = controls['photo_ref'], controls['info']
+        else:
+            photo, w, h = create_image_preview(filepath, max_width=400, scale_percent=scale)
+            info = get_image_info(filepath) if photo else None
+            controls['photo_ref'] = photo
+            controls['info'] = info
+            controls['preview_key'] = key if photo else None
         
         if photo:
-            self.image_controls['question']['photo_ref'] = photo
-            label = tk.Label(preview_frame, image=photo)
-            label.pack(pady=5)
+            self._preview_image_label.configure(image=photo)
+            self._preview_image_label.pack(pady=5)
             
-            info = get_image_info(filepath)
             if info:
                 info_text = f"{info['width']}x{info['height']} • {format_file_size(info['size'])}"
-                ttk.Label(preview_frame, text=info_text, font=('', 8), 
-                         foreground='gray').pack()
+                self._preview_info_label.configure(text=info_text)
+                self._preview_info_label.pack()
     
     def _select_option_image(self, index: int):
         """Select option image"""
         filepath = select_image_file(self.parent_frame, f"Select Option {index} Image")
         if filepath:
-            self.temp_image_paths[f'option_{index}'] = filepath
-            self.image_controls[f'option_{index}']['path_var'].set(os.path.basename(filepath))
+            key = _OPTION_KEYS[index]
+            self.temp_image_paths[key] = filepath
+            self.image_controls[key]['path_var'].set(os.path.basename(filepath))
     
     def _remove_option_image(self, index: int):
         """Remove option image"""
-        key = f'option_{index}'
+        key = _OPTION_KEYS[index]
         if key in self.temp_image_paths:
             del self.temp_image_paths[key]
         self.image_controls[key]['path_var'].set("")
@@ -238,15 +285,13 @@ class MultipleChoiceForm(BaseQuestionForm):
             self.image_options_frame.pack(fill=tk.X, pady=5)
             
             # Restore saved image options if any
-            for i in range(4):
-                key = f'option_{i}'
+            for key in _OPTION_KEYS:
                 if key in self.saved_image_options:
                     self.temp_image_paths[key] = self.saved_image_options[key]
                     self.image_controls[key]['path_var'].set(os.path.basename(self.saved_image_options[key]))
         else:
             # Save image options
-            for i in range(4):
-                key = f'option_{i}'
+            for key in _OPTION_KEYS:
                 if key in self.temp_image_paths:
                     self.saved_image_options[key] = self.temp_image_paths[key]
             
@@ -286,14 +331,15 @@ class MultipleChoiceForm(BaseQuestionForm):
             
             # Load option images
             for idx, path in self.question.optionImages.items():
-                key = f'option_{int(idx)}'
+                key = _OPTION_KEYS[int(idx)]
                 # Path already saved - keep as-is
                 self.temp_image_paths[key] = path
-                self.image_controls[key]['path_var'].set(os.path.basename(path))
+                name = os.path.basename(path)
                 
                 # Check if file exists and show warning
                 if not os.path.exists(path):
-                    self.image_controls[key]['path_var'].set(f"⚠ {os.path.basename(path)} (missing)")
+                    name = f"⚠ {name} (missing)"
+                self.image_controls[key]['path_var'].set(name)
             
             # Load option scale
             if hasattr(self.question, 'optionImageScale'):
@@ -313,37 +359,23 @@ class MultipleChoiceForm(BaseQuestionForm):
             # Question text
             data['question'] = self.question_text.get('1.0', tk.END).strip()
             
-            # Question image - CRITICAL PATH HANDLING
+            # Question image - new files are copied into the subject folder
+            # by build_question() (attach_question_image), once validation passed
             if 'question' in self.temp_image_paths:
-                img_path = self.temp_image_paths['question']
-                # If editing and path already saved (starts with 'images/'), keep it
-                if img_path.startswith('images/'):
-                    data['questionImage'] = img_path
-                    data['questionImageScale'] = self.image_controls['question']['scale_var'].get()
-                else:
-                    # New image - needs to be copied
-                    # Get question ID (from existing question or will be assigned by caller)
-                    q_id = self.question.id if self.question else None
-                    if q_id:
-                        rel_path = copy_image_to_subject(img_path, self.subject.name, q_id, 'main')
-                        if rel_path:
-                            data['questionImage'] = rel_path
-                            data['questionImageScale'] = validate_scale(
-                                self.image_controls['question']['scale_var'].get()
-                            )
+                data['questionImage'] = self.temp_image_paths['question']
+                data['questionImageScale'] = self.image_controls['question']['scale_var'].get()
             
             # Options handling
             if self.use_option_images_var.get():
                 # Using images
                 data['use_option_images'] = True
                 data['option_images_temp'] = {}
-                for i in range(4):
-                    key = f'option_{i}'
+                for i, key in enumerate(_OPTION_KEYS):
                     if key in self.temp_image_paths:
                         data['option_images_temp'][i] = self.temp_image_paths[key]
                 data['option_scale'] = self.option_scale_var.get()
                 # Use placeholder text
-                data['options'] = [f"Option {i}" for i in range(4)]
+                data['options'] = list(_DEFAULT_OPTION_LABELS)
             else:
                 # Using text
                 data['use_option_images'] = False
@@ -368,19 +400,20 @@ class MultipleChoiceForm(BaseQuestionForm):
             return False, "Question text is required"
         
         # Validate options
-        if self.use_option_images_var.get():
+        use_images = self.use_option_images_var.get()
+        if use_images:
             # Validate all 4 images present
-            for i in range(4):
-                if f'option_{i}' not in self.temp_image_paths:
+            for i, key in enumerate(_OPTION_KEYS):
+                if key not in self.temp_image_paths:
                     return False, f"Please upload image for Option {i}"
             
             # Check if files exist (for edit mode)
-            for i in range(4):
-                path = self.temp_image_paths[f'option_{i}']
+            for i, key in enumerate(_OPTION_KEYS):
+                path = self.temp_image_paths[key]
                 if not path.startswith('images/') and not os.path.exists(path):
                     return False, f"Option {i} image file not found"
         else:
-            # Validate text options
+            # Validate text options (also used for the correct answer range below)
             opts = [o.strip() for o in self.options_text.get('1.0', tk.END).split('\n') if o.strip()]
             
             if len(opts) < 2:
@@ -394,14 +427,33 @@ class MultipleChoiceForm(BaseQuestionForm):
         try:
             correct = int(self.correct_var.get())
             
-            if self.use_option_images_var.get():
+            if use_images:
                 if correct < 0 or correct > 3:
                     return False, "Correct answer must be between 0 and 3"
             else:
-                opts = [o.strip() for o in self.options_text.get('1.0', tk.END).split('\n') if o.strip()]
                 if correct < 0 or correct >= len(opts):
                     return False, f"Correct answer must be between 0 and {len(opts)-1}"
         except ValueError:
             return False, "Invalid correct answer index"
         
         return True, ""
+    
+    def build_question(self, question_id, lesson_id, data):
+        """Create Multiple Choice question from data"""
+        new_question = MultipleChoiceQuestion(
+            id=question_id,
+            type='multiple_choice',
+            lessonId=lesson_id,
+            question=data['question'],
+            options=data['options'],
+            correct=data['correct']
+        )
+        
+        self.attach_question_image(new_question, question_id, data)
+        return self.attach_option_images(new_question, question_id, data)
+    
+    def cleanup(self):
+        """Cancel a pending preview redraw before the form is destroyed"""
+        if self._scale_after_id is not None:
+            self.parent_frame.after_cancel(self._scale_after_id)
+            self._scale_after_id = None
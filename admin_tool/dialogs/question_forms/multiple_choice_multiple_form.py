@@ -17,11 +17,9 @@ from admin_tool.dialogs.question_forms.base_form import BaseQuestionForm
 try:
     from utils.image_helper import (
         select_image_file,
-        copy_image_to_subject,
         create_image_preview,
         get_image_info,
         format_file_size,
-        validate_scale,
         DEFAULT_SCALE
     )
     IMAGE_HELPER_AVAILABLE = True
@@ -351,21 +349,11 @@ class MultipleChoiceMultipleForm(BaseQuestionForm):
             # Question text
             data['question'] = self.question_text.get('1.0', tk.END).strip()
             
-            # Question image
+            # Question image - new files are copied into the subject folder
+            # by build_question() (attach_question_image), once validation passed
             if 'question' in self.temp_image_paths:
-                img_path = self.temp_image_paths['question']
-                if img_path.startswith('images/'):
-                    data['questionImage'] = img_path
-                    data['questionImageScale'] = self.image_controls['question']['scale_var'].get()
-                else:
-                    q_id = self.question.id if self.question else None
-                    if q_id:
-                        rel_path = copy_image_to_subject(img_path, self.subject.name, q_id, 'main')
-                        if rel_path:
-                            data['questionImage'] = rel_path
-                            data['questionImageScale'] = validate_scale(
-                                self.image_controls['question']['scale_var'].get()
-                            )
+                data['questionImage'] = self.temp_image_paths['question']
+                data['questionImageScale'] = self.image_controls['question']['scale_var'].get()
             
             # Options handling
             if self.use_option_images_var.get():
@@ -436,3 +424,17 @@ class MultipleChoiceMultipleForm(BaseQuestionForm):
             print("ℹ️ Note: All options are marked as correct")
         
         return True, ""
+    
+    def build_question(self, question_id, lesson_id, data):
+        """Create Multiple Choice Multiple question from data"""
+        new_question = MultipleChoiceMultipleQuestion(
+            id=question_id,
+            type='multiple_choice_multiple',
+            lessonId=lesson_id,
+            question=data['question'],
+            options=data['options'],
+            correct=data['correct']  # This is a LIST of indices
+        )
+        
+        self.attach_question_image(new_question, question_id, data)
+        return self.attach_option_images(new_question, question_id, data)
@@ -17,11 +17,9 @@ from admin_tool.dialogs.question_forms.base_form import BaseQuestionForm
 try:
     from utils.image_helper import (
         select_image_file,
-        copy_image_to_subject,
         create_image_preview,
         get_image_info,
         format_file_size,
-        validate_scale,
         DEFAULT_SCALE
     )
     IMAGE_HELPER_AVAILABLE = True
@@ -184,21 +182,11 @@ class ReadingComprehensionForm(BaseQuestionForm):
             # Passage text
             data['passage'] = self.passage_text.get('1.0', tk.END).strip()
             
-            # Question image
+            # Question image - new files are copied into the subject folder
+            # by build_question() (attach_question_image), once validation passed
             if 'question' in self.temp_image_paths:
-                img_path = self.temp_image_paths['question']
-                if img_path.startswith('images/'):
-                    data['questionImage'] = img_path
-                    data['questionImageScale'] = self.image_controls['question']['scale_var'].get()
-                else:
-                    q_id = self.question.id if self.question else None
-                    if q_id:
-                        rel_path = copy_image_to_subject(img_path, self.subject.name, q_id, 'main')
-                        if rel_path:
-                            data['questionImage'] = rel_path
-                            data['questionImageScale'] = validate_scale(
-                                self.image_controls['question']['scale_var'].get()
-                            )
+                data['questionImage'] = self.temp_image_paths['question']
+                data['questionImageScale'] = self.image_controls['question']['scale_var'].get()
             
             # Parse sub-questions
             lines = [l.strip() for l in self.questions_text.get('1.0', tk.END).split('\n') 
@@ -248,39 +236,55 @@ class ReadingComprehensionForm(BaseQuestionForm):
     
     def validate(self) -> Tuple[bool, str]:
         """Validate form data"""
-        passage_text = self.passage_text.get('1.0', tk.END).strip()
+        is_valid, error, _ = self.validate_and_collect()
+        return is_valid, error
+    
+    def validate_and_collect(self) -> Tuple[bool, str, Optional[Dict[str, Any]]]:
+        """Validate form data, returning what was collected so save() can reuse it"""
+        # Collect once and validate what was read (no second Text.get round trip)
+        data = self.collect_data()
         
+        if not data:
+            return False, "Failed to collect form data", None
+        
+        passage_text = data['passage']
         if not passage_text:
-            return False, "Passage text is required"
+            return False, "Passage text is required", None
         
         if len(passage_text) < 20:
-            return False, "Passage is too short (minimum 20 characters)"
-        
-        # Collect and validate sub-questions
-        data = self.collect_data()
-        
-        if not data:
-            return False, "Failed to collect form data"
+            return False, "Passage is too short (minimum 20 characters)", None
         
         if 'error' in data:
-            return False, data['error']
+            return False, data['error'], None
         
         sub_questions = data.get('sub_questions', [])
         
         if len(sub_questions) < 1:
-            return False, "At least 1 question is required"
+            return False, "At least 1 question is required", None
         
         # Additional validation for each sub-question
         for i, sq in enumerate(sub_questions):
             if not sq.get('question'):
-                return False, f"Question {i+1} text is empty"
+                return False, f"Question {i+1} text is empty", None
             
             options = sq.get('options', [])
             if len(options) < 2:
-                return False, f"Question {i+1} needs at least 2 options"
+                return False, f"Question {i+1} needs at least 2 options", None
             
             for j, opt in enumerate(options):
                 if not opt:
-                    return False, f"Question {i+1}, option {j+1} is empty"
+                    return False, f"Question {i+1}, option {j+1} is empty", None
         
-        return True, ""
+        return True, "", data
+    
+    def build_question(self, question_id, lesson_id, data):
+        """Create Reading Comprehension question from data"""
+        new_question = ReadingComprehensionQuestion(
+            id=question_id,
+            type='reading_comprehension',
+            lessonId=lesson_id,
+            passage=data['passage'],
+            passageId=f"passage_{question_id}",
+            questions=data['sub_questions']
+        )
+        return self.attach_question_image(new_question, question_id, data)
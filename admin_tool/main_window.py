@@ -223,7 +223,7 @@ class MainWindow:
             return
         
         # Validate name
-        existing_names = [l.name for l in self.current_subject.lessons]
+        existing_names = {l.name for l in self.current_subject.lessons}
         is_valid, error = LessonValidator.validate_lesson_name(lesson_name, existing_names)
         if not is_valid:
             messagebox.showerror("Invalid Name", error)
@@ -267,14 +267,16 @@ class MainWindow:
             return
         
         # Validate name
-        existing_names = [l.name for l in self.current_subject.lessons if l.id != lesson_id]
+        existing_names = {l.name for l in self.current_subject.lessons if l.id != lesson_id}
         is_valid, error = LessonValidator.validate_lesson_name(new_name, existing_names)
         if not is_valid:
             messagebox.showerror("Invalid Name", error)
             return
         
-        # Update lesson
+        # Update lesson (renamed in place - drop the cached lesson choices
+        # now, so a failed save can't leave QuestionDialog with stale names)
         lesson.name = new_name
+        self.current_subject.invalidate_lesson_choices()
         
         if self.data_manager.save_subject(self.current_subject):
             self.tree_manager.refresh_tree(self.current_subject,
@@ -325,13 +327,14 @@ class MainWindow:
         lessons = self.current_subject.lessons
         
         # Find lesson index
-        lesson_idx = next((i for i, l in enumerate(lessons) if l.id == lesson_id), None)
+        lesson_idx = self.current_subject.get_lesson_index(lesson_id)
         
         if lesson_idx is None or lesson_idx == 0:
             return
         
         # Swap with previous
         lessons[lesson_idx], lessons[lesson_idx - 1] = lessons[lesson_idx - 1], lessons[lesson_idx]
+        self.current_subject.invalidate_lesson_choices()
         
         if self.data_manager.save_subject(self.current_subject):
             self.tree_manager.refresh_tree(self.current_subject,
@@ -347,13 +350,14 @@ class MainWindow:
         lessons = self.current_subject.lessons
         
         # Find lesson index
-        lesson_idx = next((i for i, l in enumerate(lessons) if l.id == lesson_id), None)
+        lesson_idx = self.current_subject.get_lesson_index(lesson_id)
         
         if lesson_idx is None or lesson_idx >= len(lessons) - 1:
             return
         
         # Swap with next
         lessons[lesson_idx], lessons[lesson_idx + 1] = lessons[lesson_idx + 1], lessons[lesson_idx]
+        self.current_subject.invalidate_lesson_choices()
         
         if self.data_manager.save_subject(self.current_subject):
             self.tree_manager.refresh_tree(self.current_subject,
@@ -574,7 +578,7 @@ class MainWindow:
             lesson_idx = lesson_names.index(var.get())
             new_lesson_id = lesson_ids[lesson_idx]
             
-            question.lessonId = new_lesson_id
+            self.current_subject.move_questions([question], new_lesson_id)
             
             if self.data_manager.save_subject(self.current_subject):
                 dialog.destroy()
@@ -666,10 +670,8 @@ class MainWindow:
             new_lesson_id = lesson_ids[lesson_idx]
             
             # Move all questions
-            for qid in question_ids:
-                question = self.current_subject.get_question_by_id(qid)
-                if question:
-                    question.lessonId = new_lesson_id
+            questions = [self.current_subject.get_question_by_id(qid) for qid in question_ids]
+            self.current_subject.move_questions([q for q in questions if q], new_lesson_id)
             
             if self.data_manager.save_subject(self.current_subject):
                 dialog.destroy()
@@ -727,7 +729,7 @@ class MainWindow:
             return
         
         # Toggle status
-        current_status = getattr(lesson, 'enabled', True)
+        current_status = lesson.enabled
         lesson.enabled = not current_status
         
         # Get questions in this lesson
@@ -742,7 +744,7 @@ class MainWindow:
                         q.enabled = False
         else:
             # ENABLING lesson - ask about cascading enable
-            disabled_questions = [q for q in questions if not getattr(q, 'enabled', True)]
+            disabled_questions = [q for q in questions if not q.enabled]
             if disabled_questions:
                 if messagebox.askyesno("Cascade Enable", 
                                       f"Also enable {len(disabled_questions)} disabled question(s) in this lesson?"):
@@ -765,7 +767,7 @@ class MainWindow:
             return
         
         # Toggle status
-        current_status = getattr(question, 'enabled', True)
+        current_status = question.enabled
         question.enabled = not current_status
         
         # Save and refresh
@@ -821,7 +823,7 @@ class MainWindow:
         for lesson_id in lessons_to_toggle:
             lesson = self.current_subject.get_lesson_by_id(lesson_id)
             if lesson:
-                current_status = getattr(lesson, 'enabled', True)
+                current_status = lesson.enabled
                 lesson.enabled = not current_status
                 
                 # Cascade to questions if requested
@@ -833,7 +835,7 @@ class MainWindow:
         for q_id in questions_to_toggle:
             question = self.current_subject.get_question_by_id(q_id)
             if question:
-                current_status = getattr(question, 'enabled', True)
+                current_status = question.enabled
                 question.enabled = not current_status
         
         # Save and refresh
@@ -57,13 +57,13 @@ class TreeManager:
         for lesson in subject.lessons:
             lesson_id = lesson.id
             lesson_name = lesson.name
-            lesson_enabled = getattr(lesson, 'enabled', True)
+            lesson_enabled = lesson.enabled
             
             # Get questions in this lesson
             questions = subject.get_questions_by_lesson(lesson_id)
             
             # Count ENABLED questions only
-            enabled_count = sum(1 for q in questions if getattr(q, 'enabled', True))
+            enabled_count = sum(1 for q in questions if q.enabled)
             
             # Visual indicator for disabled lesson
             status_icon = "" if lesson_enabled else "🚫 "
@@ -91,7 +91,7 @@ class TreeManager:
         others_questions = subject.get_questions_by_lesson(None)
         
         # Count ENABLED questions in Others
-        enabled_count = sum(1 for q in others_questions if getattr(q, 'enabled', True))
+        enabled_count = sum(1 for q in others_questions if q.enabled)
         
         others_text = f"{OTHERS_DISPLAY} ({enabled_count})"
         others_node = self.tree.insert('', 'end', text=others_text,
@@ -117,7 +117,7 @@ class TreeManager:
             question: Question object to add
         """
         qtype_short = QUESTION_TYPE_ICONS.get(question.type, '?')
-        question_enabled = getattr(question, 'enabled', True)
+        question_enabled = question.enabled
         
         # Get question text
         if hasattr(question, 'question'):
@@ -6,18 +6,146 @@ Version: 2.3 - Added enabled/disabled status display
 import tkinter as tk
 from tkinter import ttk
 import os
+from collections import Counter
+from functools import lru_cache
+from typing import List, Tuple
 
 from shared.models import Subject, Lesson, Question
-from shared.constants import QUESTION_TYPE_NAMES
+from shared.constants import QTN_GET, PREVIEW_RESAMPLE
 
 # Try to import PIL for image preview
 try:
     from PIL import Image, ImageTk
     PIL_AVAILABLE = True
+    _PREVIEW_FILTER = getattr(Image.Resampling, PREVIEW_RESAMPLE)
 except ImportError:
     PIL_AVAILABLE = False
 
 
+# Text is inserted into the details widget in slices of this many characters,
+# one slice per idle callback, so large summaries don't block the selection
+_INSERT_CHUNK_SIZE = 4096
+
+# Smallest preview size (in either dimension); smaller previews are scaled up to it
+_MIN_PREVIEW_SIZE = 4
+
+_SEP_EQ = "=" * 50
+_SEP_DASH = "-" * 50
+
+# Panel headers; the trailing newline yields the blank line once parts are joined
+_HEADER_Q = f"QUESTION DETAILS\n{_SEP_EQ}\n"
+_HEADER_LESSON = f"LESSON DETAILS\n{_SEP_EQ}\n"
+_HEADER_OTHERS = f"OTHERS (UNASSIGNED)\n{_SEP_EQ}\n"
+_BODY_BREAK = ("", _SEP_DASH, "")
+
+
+@lru_cache(maxsize=None)
+def _type_line(qtype: str) -> str:
+    """Header line naming the question type (one entry per type)"""
+    return f"Type: {QTN_GET(qtype, qtype)}"
+
+
+def _option_image_indicator(q: Question, index: int) -> str:
+    """Marker shown next to options that have an image attached"""
+    if getattr(q, 'optionImages', None) and q.optionImages.get(str(index)):
+        return " 🖼️"
+    return ""
+
+
+def _fmt_multiple_choice(q: Question) -> List[str]:
+    lines = ["Question:", q.question, "", "Options:"]
+    for i, opt in enumerate(q.options):
+        mark = "✓" if i == q.correct else " "
+        lines.append(f"  [{mark}] {i}. {opt}{_option_image_indicator(q, i)}")
+    return lines
+
+
+def _fmt_multiple_choice_multiple(q: Question) -> List[str]:
+    lines = ["Question:", q.question, "", "Options:"]
+    for i, opt in enumerate(q.options):
+        mark = "✓" if i in q.correct else " "
+        lines.append(f"  [{mark}] {i}. {opt}{_option_image_indicator(q, i)}")
+    
+    # Show all correct answers
+    correct_indices = ", ".join(str(i) for i in sorted(q.correct))
+    lines.extend(["", f"Correct answers: {correct_indices}"])
+    return lines
+
+
+def _fmt_true_false(q: Question) -> List[str]:
+    return ["Question:", q.question, "", f"Answer: {'True' if q.correct == 0 else 'False'}"]
+
+
+def _fmt_fill_in_blank(q: Question) -> List[str]:
+    lines = ["Question:", q.question, ""]
+    # Check if multi-blank or single-blank
+    if q.is_multi_blank():
+        # Multi-blank format (new)
+        lines.append("Acceptable Answers (Multi-Blank):")
+        for blank_id in q.get_blank_ids():
+            lines.extend(["", f"  _Q{blank_id.replace('Q', '')}_:"])
+            for ans in q.get_acceptable_answers(blank_id):
+                lines.append(f"    • {ans}")
+    else:
+        # Single-blank format (old)
+        lines.append("Accepted Answers:")
+        for ans in q.get_acceptable_answers('Q1'):
+            lines.append(f"  • {ans}")
+    return lines
+
+
+def _fmt_dropdown(q: Question) -> List[str]:
+    lines = ["Question:", q.question, "", "Dropdowns:"]
+    for dd_id in q.get_dropdown_ids():
+        display_id = dd_id.replace('DD', '')
+        correct_idx = q.get_correct_index(dd_id)
+        
+        lines.extend(["", f"  [DD{display_id}]:"])
+        for i, opt in enumerate(q.get_options(dd_id)):
+            mark = "✓" if i == correct_idx else " "
+            lines.append(f"    [{mark}] {i}. {opt}")
+    return lines
+
+
+def _fmt_matching(q: Question) -> List[str]:
+    lines = ["Question:", q.question, "", "Pairs:"]
+    for p in q.pairs:
+        lines.append(f"  {p.get('country', '')} → {p.get('capital', '')}")
+    return lines
+
+
+def _fmt_reordering(q: Question) -> List[str]:
+    lines = ["Question:", q.question, "", "Correct Order:"]
+    sorted_items = sorted(q.items, key=lambda x: x.get('order', 0))
+    for i, item in enumerate(sorted_items, 1):
+        lines.append(f"  {i}. {item.get('text', '')}")
+    return lines
+
+
+def _fmt_reading_comprehension(q: Question) -> List[str]:
+    lines = ["Passage:", q.passage, "", "Sub-Questions:"]
+    for i, sq in enumerate(q.questions, 1):
+        lines.extend(["", f"  {i}. {sq.get('question', '')}"])
+        correct = sq.get('correct')
+        for j, opt in enumerate(sq.get('options', [])):
+            mark = "✓" if j == correct else " "
+            lines.append(f"     [{mark}] {opt}")
+    return lines
+
+
+# Type-specific body formatters, keyed by question type
+_FORMATTERS = {
+    'multiple_choice': _fmt_multiple_choice,
+    'multiple_choice_multiple': _fmt_multiple_choice_multiple,
+    'true_false': _fmt_true_false,
+    'fill_in_blank': _fmt_fill_in_blank,
+    'dropdown': _fmt_dropdown,
+    'matching': _fmt_matching,
+    'reordering': _fmt_reordering,
+    'reading_comprehension': _fmt_reading_comprehension,
+}
+
+
 class DetailsPanel:
     """Widget for displaying details of selected items"""
     
@@ -25,6 +153,13 @@ class DetailsPanel:
         self.parent_frame = parent_frame
         self.main_window = main_window
         
+        # after_idle id of the pending chunked text insert (if any)
+        self._pending_insert = None
+        
+        # Last rendered preview, reused when the same image is shown again
+        self._last_preview_key = None
+        self._last_photo = None
+        
         self.setup_ui()
     
     def setup_ui(self):
@@ -50,25 +185,30 @@ class DetailsPanel:
         # Update scrollregion when content changes
         self.content_frame.bind('<Configure>', 
                                lambda e: self.canvas.configure(scrollregion=self.canvas.bbox('all')))
+        
+        # Persistent content widgets, reused for every selection
+        # (packed on demand, hidden by clear())
+        self._text_widget = tk.Text(self.content_frame, font=('Consolas', 9), 
+                                    wrap=tk.WORD, height=15, width=50)
+        self._image_label = tk.Label(self.content_frame)
+        self._image_info_label = ttk.Label(self.content_frame, font=('', 8))
     
     def clear(self):
         """Clear the details panel"""
-        for widget in self.content_frame.winfo_children():
-            widget.destroy()
+        self._cancel_pending_insert()
+        self._text_widget.pack_forget()
+        self._image_label.pack_forget()
+        self._image_label.configure(image='')
+        self._image_label.image = None
+        self._image_info_label.pack_forget()
     
     def show_question(self, question: Question, subject: Subject):
         """Display question details"""
         self.clear()
         
-        # Create text widget
-        text_widget = tk.Text(self.content_frame, font=('Consolas', 9), 
-                             wrap=tk.WORD, height=15, width=50)
-        text_widget.pack(fill=tk.X, padx=5, pady=5)
-        
         # Format question details
         details = self._format_question_text(question, subject)
-        text_widget.insert('1.0', details)
-        text_widget.config(state=tk.DISABLED)
+        self._show_text(details, height=15, fill=tk.X, expand=False)
         
         # Show question image if exists
         if question.questionImage and PIL_AVAILABLE:
@@ -79,213 +219,169 @@ class DetailsPanel:
         """Display lesson summary"""
         self.clear()
         
-        text_widget = tk.Text(self.content_frame, font=('Consolas', 9), 
-                             wrap=tk.WORD, height=20, width=50)
-        text_widget.pack(fill=tk.BOTH, expand=True, padx=5, pady=5)
-        
         # Get lesson statistics
         questions = subject.get_questions_by_lesson(lesson.id)
-        enabled_count = sum(1 for q in questions if getattr(q, 'enabled', True))
+        enabled_count, breakdown = self._summarize_questions(questions)
         disabled_count = len(questions) - enabled_count
         
         # Get lesson status
-        lesson_enabled = getattr(lesson, 'enabled', True)
+        lesson_enabled = lesson.enabled
         status_text = "✓ Enabled" if lesson_enabled else "🚫 Disabled"
         
-        details = f"LESSON DETAILS\n{'='*50}\n\n"
-        details += f"Name: {lesson.name}\n"
-        details += f"ID: {lesson.id}\n"
-        details += f"Status: {status_text}\n"
-        details += f"Questions: {enabled_count}\n"
+        parts = [
+            _HEADER_LESSON,
+            f"Name: {lesson.name}",
+            f"ID: {lesson.id}",
+            f"Status: {status_text}",
+            f"Questions: {enabled_count}",
+        ]
         
         if disabled_count > 0:
-            details += f"Disabled Questions: {disabled_count}\n"
-        
-        details += "\n"
+            parts.append(f"Disabled Questions: {disabled_count}")
         
-        if questions:
-            # Show question types breakdown (enabled only)
-            details += "Question Types (Enabled):\n"
-            types = {}
-            for q in questions:
-                if getattr(q, 'enabled', True):
-                    qtype = QUESTION_TYPE_NAMES.get(q.type, q.type)
-                    types[qtype] = types.get(qtype, 0) + 1
-            
-            if types:
-                for qtype, count in sorted(types.items()):
-                    details += f"  • {qtype}: {count}\n"
-            else:
-                details += "  (All questions are disabled)\n"
-            
-            # Count with images (enabled only)
-            with_images = sum(1 for q in questions 
-                            if q.questionImage and getattr(q, 'enabled', True))
-            if with_images > 0:
-                details += f"\nWith images: {with_images}\n"
+        parts.append("")
+        parts.extend(breakdown)
+        parts.append("")
+        details = "\n".join(parts)
         
-        text_widget.insert('1.0', details)
-        text_widget.config(state=tk.DISABLED)
+        self._show_text(details, height=20, fill=tk.BOTH, expand=True)
     
     def show_others(self, subject: Subject):
         """Display Others category summary"""
         self.clear()
         
-        text_widget = tk.Text(self.content_frame, font=('Consolas', 9), 
-                             wrap=tk.WORD, height=20, width=50)
-        text_widget.pack(fill=tk.BOTH, expand=True, padx=5, pady=5)
-        
         questions = subject.get_questions_by_lesson(None)
-        enabled_count = sum(1 for q in questions if getattr(q, 'enabled', True))
+        enabled_count, breakdown = self._summarize_questions(questions)
         disabled_count = len(questions) - enabled_count
         
-        details = f"OTHERS (UNASSIGNED)\n{'='*50}\n\n"
-        details += f"Questions: {enabled_count}\n"
+        parts = [
+            _HEADER_OTHERS,
+            f"Questions: {enabled_count}",
+        ]
         
         if disabled_count > 0:
-            details += f"Disabled Questions: {disabled_count}\n"
+            parts.append(f"Disabled Questions: {disabled_count}")
+        
+        parts.append("")
+        parts.extend(breakdown)
+        parts.append("")
+        details = "\n".join(parts)
         
-        details += "\n"
+        self._show_text(details, height=20, fill=tk.BOTH, expand=True)
+    
+    def _show_text(self, details: str, height: int, fill: str, expand: bool):
+        """Show details in the shared text widget"""
+        self._text_widget.config(height=height)
+        self._text_widget.pack(fill=fill, expand=expand, padx=5, pady=5)
+        self._fill_text(details)
+    
+    def _fill_text(self, details: str):
+        """Replace text widget contents progressively, then lock it read-only"""
+        self._cancel_pending_insert()
+        self._text_widget.config(state=tk.NORMAL)
+        self._text_widget.delete('1.0', tk.END)
+        self._insert_chunks(details, 0)
+    
+    def _insert_chunks(self, details: str, start: int):
+        """Insert one slice of details and schedule the next on idle"""
+        end = start + _INSERT_CHUNK_SIZE
+        self._text_widget.insert(tk.END, details[start:end])
         
+        if end < len(details):
+            self._pending_insert = self.canvas.after_idle(self._insert_chunks, details, end)
+        else:
+            self._pending_insert = None
+            self._text_widget.config(state=tk.DISABLED)
+    
+    def _cancel_pending_insert(self):
+        """Cancel an in-progress chunked insert from a previous selection"""
+        if self._pending_insert is not None:
+            self.canvas.after_cancel(self._pending_insert)
+            self._pending_insert = None
+    
+    def _summarize_questions(self, questions: List[Question]) -> Tuple[int, List[str]]:
+        """
+        Aggregate enabled questions in a single pass
+        Returns: (enabled_count, breakdown_lines)
+        """
+        types = Counter()
+        with_images = 0
+        for q in questions:
+            if q.enabled:
+                types[q.type] += 1
+                if q.questionImage:
+                    with_images += 1
+        
+        lines = []
         if questions:
             # Show question types breakdown (enabled only)
-            details += "Question Types (Enabled):\n"
-            types = {}
-            for q in questions:
-                if getattr(q, 'enabled', True):
-                    qtype = QUESTION_TYPE_NAMES.get(q.type, q.type)
-                    types[qtype] = types.get(qtype, 0) + 1
-            
+            lines.append("Question Types (Enabled):")
             if types:
-                for qtype, count in sorted(types.items()):
-                    details += f"  • {qtype}: {count}\n"
+                named = sorted((QTN_GET(qtype, qtype), count) for qtype, count in types.items())
+                for qtype, count in named:
+                    lines.append(f"  • {qtype}: {count}")
             else:
-                details += "  (All questions are disabled)\n"
+                lines.append("  (All questions are disabled)")
             
             # Count with images (enabled only)
-            with_images = sum(1 for q in questions 
-                            if q.questionImage and getattr(q, 'enabled', True))
             if with_images > 0:
-                details += f"\nWith images: {with_images}\n"
+                lines.append("")
+                lines.append(f"With images: {with_images}")
         
-        text_widget.insert('1.0', details)
-        text_widget.config(state=tk.DISABLED)
+        return sum(types.values()), lines
     
     def _format_question_text(self, q: Question, subject: Subject) -> str:
         """Format question for text display"""
-        qtype_name = QUESTION_TYPE_NAMES.get(q.type, q.type)
-        
         # Get question status
-        question_enabled = getattr(q, 'enabled', True)
+        question_enabled = q.enabled
         status_text = "✓ Enabled" if question_enabled else "🚫 Disabled"
         
-        text = f"QUESTION DETAILS\n{'='*50}\n\n"
-        text += f"Type: {qtype_name}\n"
-        text += f"ID: {q.id}\n"
-        text += f"Status: {status_text}\n"
+        parts = [
+            _HEADER_Q,
+            _type_line(q.type),
+            f"ID: {q.id}",
+            f"Status: {status_text}",
+        ]
         
         # Show lesson
         if q.lessonId:
             lesson = subject.get_lesson_by_id(q.lessonId)
             if lesson:
-                lesson_enabled = getattr(lesson, 'enabled', True)
+                lesson_enabled = lesson.enabled
                 lesson_status = " (Disabled)" if not lesson_enabled else ""
-                text += f"Lesson: {lesson.name}{lesson_status}\n"
+                parts.append(f"Lesson: {lesson.name}{lesson_status}")
             else:
-                text += "Lesson: Unknown\n"
+                parts.append("Lesson: Unknown")
         else:
-            text += "Lesson: Others\n"
+            parts.append("Lesson: Others")
         
         # Image info
         if q.questionImage:
-            text += f"📷 Image: {os.path.basename(q.questionImage)} ({q.questionImageScale}%)\n"
+            parts.append(f"📷 Image: {os.path.basename(q.questionImage)} ({q.questionImageScale}%)")
         
-        text += "\n" + "-" * 50 + "\n\n"
+        parts.extend(_BODY_BREAK)
         
         # Type-specific details
-        if q.type == "multiple_choice":
-            text += f"Question:\n{q.question}\n\nOptions:\n"
-            for i, opt in enumerate(q.options):
-                mark = "✓" if i == q.correct else " "
-                img_indicator = " 🖼️" if hasattr(q, 'optionImages') and q.optionImages and q.optionImages.get(str(i)) else ""
-                text += f"  [{mark}] {i}. {opt}{img_indicator}\n"
-        
-        elif q.type == "multiple_choice_multiple":
-            text += f"Question:\n{q.question}\n\nOptions:\n"
-            for i, opt in enumerate(q.options):
-                mark = "✓" if i in q.correct else " "
-                img_indicator = " 🖼️" if hasattr(q, 'optionImages') and q.optionImages and q.optionImages.get(str(i)) else ""
-                text += f"  [{mark}] {i}. {opt}{img_indicator}\n"
-            
-            # Show all correct answers
-            correct_indices = ", ".join(str(i) for i in sorted(q.correct))
-            text += f"\nCorrect answers: {correct_indices}\n"
-        
-        elif q.type == "true_false":
-            text += f"Question:\n{q.question}\n\n"
-            text += f"Answer: {'True' if q.correct == 0 else 'False'}\n"
-        
-        elif q.type == "fill_in_blank":
-            text += f"Question:\n{q.question}\n\n"
-            # Check if multi-blank or single-blank
-            if q.is_multi_blank():
-                # Multi-blank format (new)
-                text += "Acceptable Answers (Multi-Blank):\n"
-                blank_ids = q.get_blank_ids()
-                for blank_id in blank_ids:
-                    answers = q.get_acceptable_answers(blank_id)
-                    text += f"\n  _Q{blank_id.replace('Q', '')}_:\n"
-                    for ans in answers:
-                        text += f"    • {ans}\n"
-            else:
-                # Single-blank format (old)
-                text += "Accepted Answers:\n"
-                answers = q.get_acceptable_answers('Q1')
-                for ans in answers:
-                    text += f"  • {ans}\n"
-        elif q.type == "dropdown":
-            text += f"Question:\n{q.question}\n\n"
-            
-            # Get dropdown IDs in order
-            dropdown_ids = q.get_dropdown_ids()
-            
-            text += "Dropdowns:\n"
-            for dd_id in dropdown_ids:
-                display_id = dd_id.replace('DD', '')
-                options = q.get_options(dd_id)
-                correct_idx = q.get_correct_index(dd_id)
-                
-                text += f"\n  [DD{display_id}]:\n"
-                for i, opt in enumerate(options):
-                    mark = "✓" if i == correct_idx else " "
-                    text += f"    [{mark}] {i}. {opt}\n"            
-        elif q.type == "matching":
-            text += f"Question:\n{q.question}\n\n"
-            text += "Pairs:\n"
-            for p in q.pairs:
-                text += f"  {p.get('country', '')} → {p.get('capital', '')}\n"
-        
-        elif q.type == "reordering":
-            text += f"Question:\n{q.question}\n\n"
-            text += "Correct Order:\n"
-            sorted_items = sorted(q.items, key=lambda x: x.get('order', 0))
-            for i, item in enumerate(sorted_items, 1):
-                text += f"  {i}. {item.get('text', '')}\n"
-        
-        elif q.type == "reading_comprehension":
-            text += f"Passage:\n{q.passage}\n\n"
-            text += "Sub-Questions:\n"
-            for i, sq in enumerate(q.questions, 1):
-                text += f"\n  {i}. {sq.get('question', '')}\n"
-                for j, opt in enumerate(sq.get('options', [])):
-                    mark = "✓" if j == sq.get('correct') else " "
-                    text += f"     [{mark}] {opt}\n"
-        
-        return text
+        handler = _FORMATTERS.get(q.type)
+        if handler:
+            parts.extend(handler(q))
+        
+        parts.append("")
+        return "\n".join(parts)
     
     def _show_image_preview(self, image_path: str, scale: int = 50):
         """Show image preview if PIL available"""
-        if not PIL_AVAILABLE or not image_path or not os.path.exists(image_path):
+        if not PIL_AVAILABLE or not image_path:
+            return
+        try:
+            mtime = os.stat(image_path).st_mtime
+        except OSError:
+            return
+        
+        # Same file at the same scale: re-show the cached PhotoImage
+        key = (image_path, scale, mtime)
+        if key == self._last_preview_key:
+            self._pack_image_preview(self._last_photo, image_path, scale)
             return
         
         try:
@@ -303,19 +399,30 @@ class DetailsPanel:
                 new_width = max_width
                 new_height = int(new_height * ratio)
             
-            img = img.resize((new_width, new_height), Image.Resampling.LANCZOS)
-            photo = ImageTk.PhotoImage(img)
+            # Keep tiny images (or extreme aspect ratios) visible rather than
+            # resizing to zero pixels
+            new_width = max(new_width, _MIN_PREVIEW_SIZE)
+            new_height = max(new_height, _MIN_PREVIEW_SIZE)
             
-            label = tk.Label(self.content_frame, image=photo)
-            label.image = photo  # Keep reference
-            label.pack(pady=5)
+            img = img.resize((new_width, new_height), _PREVIEW_FILTER)
+            photo = ImageTk.PhotoImage(img)
             
-            # Show info
-            info_label = ttk.Label(self.content_frame, 
-                                  text=f"{os.path.basename(image_path)} ({scale}%)",
-                                  font=('', 8), foreground='gray')
-            info_label.pack()
+            self._last_preview_key = key
+            self._last_photo = photo
+            self._pack_image_preview(photo, image_path, scale)
         
         except Exception as e:
-            ttk.Label(self.content_frame, text=f"Error loading image: {str(e)}",
-                     foreground='red').pack(pady=5)
\ No newline at end of file
+            self._image_info_label.configure(text=f"Error loading image: {str(e)}",
+                                             font='', foreground='red')
+            self._image_info_label.pack(pady=5)
+    
+    def _pack_image_preview(self, photo, image_path: str, scale: int):
+        """Show a rendered preview and its info line"""
+        self._image_label.configure(image=photo)
+        self._image_label.image = photo  # Keep reference
+        self._image_label.pack(pady=5)
+        
+        # Show info
+        self._image_info_label.configure(text=f"{os.path.basename(image_path)} ({scale}%)",
+                                         font=('', 8), foreground='gray')
+        self._image_info_label.pack()
@@ -12,6 +12,7 @@ import os
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
 from shared.constants import APP_TITLE, WINDOW_STATE
+from shared.data_manager import DataManager
 from admin_tool.main_window import MainWindow
 
 
@@ -19,10 +20,7 @@ def main():
     """Main application entry point"""
     try:
         # Create required folders if they don't exist
-        if not os.path.exists('questions'):
-            os.makedirs('questions')
-        if not os.path.exists('images'):
-            os.makedirs('images')
+        DataManager.ensure_dirs()
             
         # Create root window
         root = tk.Tk()
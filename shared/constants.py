@@ -3,13 +3,16 @@ Shared Constants and Configuration
 Version: 2.4 - Added dropdown question type constants
 """
 
+from types import MappingProxyType
+
 # Application Info
 APP_NAME = "Quiz Admin"
 APP_VERSION = "2.4"
 APP_TITLE = f"{APP_NAME} v{APP_VERSION} - Modular Edition"
 
 # Question Types
-QUESTION_TYPES = [
+# Tuple: immutable, and passed to the type Combobox as-is
+QUESTION_TYPES = (
     "multiple_choice",
     "multiple_choice_multiple",
     "true_false",
@@ -18,9 +21,9 @@ QUESTION_TYPES = [
     "matching",
     "reordering",
     "reading_comprehension"
-]
+)
 
-QUESTION_TYPE_NAMES = {
+QUESTION_TYPE_NAMES = MappingProxyType({
     'multiple_choice': 'Multiple Choice',
     'multiple_choice_multiple': 'Multiple Choice (Multiple Answers)',
     'true_false': 'True/False',
@@ -29,7 +32,10 @@ QUESTION_TYPE_NAMES = {
     'matching': 'Matching',
     'reordering': 'Reordering',
     'reading_comprehension': 'Reading Comprehension'
-}
+})
+
+# Bound lookup for hot display paths: QTN_GET(qtype, qtype)
+QTN_GET = QUESTION_TYPE_NAMES.get
 
 QUESTION_TYPE_ICONS = {
     'multiple_choice': 'MC',
@@ -54,6 +60,8 @@ DEFAULT_IMAGE_SCALE = 50
 MIN_IMAGE_SCALE = 25
 MAX_IMAGE_SCALE = 200
 IMAGE_SCALE_INCREMENT = 25
+# Resampling filter (PIL Image.Resampling member name) for on-screen previews
+PREVIEW_RESAMPLE = "BILINEAR"
 
 # UI Settings
 TREE_HEIGHT = 25
@@ -5,6 +5,8 @@ Version: 2.2 - Added backward compatibility for enabled field
 
 import json
 import os
+import shutil
+from datetime import datetime
 from typing import Optional, List
 from shared.models import Subject, Lesson, Question
 from shared.constants import (
@@ -13,25 +15,62 @@ from shared.constants import (
     IMAGES_FOLDER
 )
 
+# Slice bounds for extracting the subject name from a questions filename
+_PREFIX_LEN = len(QUESTIONS_FILE_PREFIX)
+_SUFFIX_LEN = len(QUESTIONS_FILE_SUFFIX)
+
+# Use orjson's native parser/serializer when installed
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+def _loads(raw: bytes):
+    """Parse JSON from raw file bytes"""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+def _dumps(data) -> str:
+    """Serialize data to indented JSON text"""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS).decode('utf-8')
+    return json.dumps(data, indent=2, ensure_ascii=False)
+
 
 class DataManager:
     """Manages loading and saving of quiz data"""
     
+    @staticmethod
+    def ensure_dirs():
+        """
+        Create the questions and images folders if they don't exist
+        Called once at application startup
+        """
+        os.makedirs('./questions', exist_ok=True)
+        os.makedirs(IMAGES_FOLDER, exist_ok=True)
+    
     @staticmethod
     def discover_subjects() -> dict:
         """
         Discover all available subjects by scanning for JSON files
         Returns: dict {subject_name: filename}
         """
-        # Create questions folder if it doesn't exist
-        if not os.path.exists('./questions'):
-            os.makedirs('./questions')
-        
         subjects = {}
-        for filename in os.listdir('./questions'):
-            if filename.startswith(QUESTIONS_FILE_PREFIX) and filename.endswith(QUESTIONS_FILE_SUFFIX):
-                subject_name = filename.replace(QUESTIONS_FILE_PREFIX, '').replace(QUESTIONS_FILE_SUFFIX, '')
-                subjects[subject_name] = os.path.join('./questions', filename)
+        try:
+            with os.scandir('./questions') as entries:
+                for entry in entries:
+                    filename = entry.name
+                    if filename.startswith(QUESTIONS_FILE_PREFIX) and filename.endswith(QUESTIONS_FILE_SUFFIX):
+                        # Slice rather than replace() so names containing the prefix/suffix survive
+                        subject_name = filename[_PREFIX_LEN:-_SUFFIX_LEN]
+                        subjects[subject_name] = entry.path
+        except FileNotFoundError:
+            # Folder not created yet (see ensure_dirs) - no subjects
+            pass
         return subjects
     
     @staticmethod
@@ -41,8 +80,8 @@ class DataManager:
         Returns: Subject object or None if failed
         """
         try:
-            with open(filename, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+            with open(filename, 'rb') as f:
+                data = _loads(f.read())
             
             # Ensure required structure
             if 'lessons' not in data:
@@ -52,21 +91,23 @@ class DataManager:
             
             # ===== BACKWARD COMPATIBILITY: Auto-migrate old data =====
             # Add 'enabled' field to lessons if missing
+            lessons_migrated = 0
             for lesson in data['lessons']:
                 if 'enabled' not in lesson:
                     lesson['enabled'] = True
-                    print(f"  Migration: Added 'enabled=True' to lesson '{lesson.get('name', 'Unknown')}'")
+                    lessons_migrated += 1
+            
+            if lessons_migrated > 0:
+                print(f"  Migration: Added 'enabled=True' to {lessons_migrated} lesson(s)")
             
             # Add 'enabled' field to questions if missing
+            # (also migrate old questions: add lessonId if missing)
             enabled_count = 0
             for question in data['questions']:
                 if 'enabled' not in question:
                     question['enabled'] = True
                     enabled_count += 1
-                
-                # Also migrate old questions (add lessonId if missing)
-                if 'lessonId' not in question:
-                    question['lessonId'] = None
+                question.setdefault('lessonId', None)
             
             if enabled_count > 0:
                 print(f"  Migration: Added 'enabled=True' to {enabled_count} question(s)")
@@ -91,16 +132,24 @@ class DataManager:
         Save a subject to JSON file
         Returns: True if successful, False otherwise
         """
+        # Write next to the target and swap it in, so a failure part-way
+        # through never leaves the only copy of the subject truncated
+        tmp_filename = f"{subject.filename}.tmp"
         try:
-            data = subject.to_dict()
-            
-            with open(subject.filename, 'w', encoding='utf-8') as f:
-                json.dump(data, f, indent=2, ensure_ascii=False)
+            # Stream one lesson/question at a time rather than building
+            # the whole subject dict first
+            with open(tmp_filename, 'w', encoding='utf-8') as f:
+                f.writelines(subject.iter_json_chunks(_dumps))
+            os.replace(tmp_filename, subject.filename)
             
+            # Callers rename/reorder lessons in place before saving
+            subject.invalidate_lesson_choices()
             return True
         
         except Exception as e:
             print(f"Error saving subject: {str(e)}")
+            if os.path.exists(tmp_filename):
+                os.remove(tmp_filename)
             return False
     
     @staticmethod
@@ -109,9 +158,6 @@ class DataManager:
         Create a new subject with empty data
         Returns: Subject object or None if failed
         """
-        # Ensure questions folder exists
-        os.makedirs('./questions', exist_ok=True)
-
         filename = f"{QUESTIONS_FILE_PREFIX}{subject_name}{QUESTIONS_FILE_SUFFIX}"
         full_path = os.path.join('./questions', filename)
     
@@ -148,7 +194,6 @@ class DataManager:
             if delete_images:
                 img_folder = os.path.join(IMAGES_FOLDER, subject.name)
                 if os.path.exists(img_folder):
-                    import shutil
                     shutil.rmtree(img_folder)
             
             return True
@@ -164,12 +209,11 @@ class DataManager:
         Returns: Backup filename or None if failed
         """
         try:
-            from datetime import datetime
             timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
             backup_filename = f"{subject.filename}.backup_{timestamp}"
             
-            import shutil
-            shutil.copy2(subject.filename, backup_filename)
+            # Timestamp is in the name; file metadata need not be preserved
+            shutil.copyfile(subject.filename, backup_filename)
             
             return backup_filename
         
@@ -187,8 +231,8 @@ class DataManager:
             return False, "File does not exist"
         
         try:
-            with open(filename, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+            with open(filename, 'rb') as f:
+                data = _loads(f.read())
             
             # Check required structure
             if not isinstance(data, dict):
@@ -212,16 +256,18 @@ class DataManager:
             return False, f"Error: {str(e)}"
     
     @staticmethod
-    def export_subject(subject: Subject, export_path: str) -> bool:
+    def export_subject(subject: Subject, export_path: str, preserve_metadata: bool = False) -> bool:
         """
         Export subject to a different location
+        preserve_metadata: also copy timestamps/permissions of the JSON file
         Returns: True if successful, False otherwise
         """
         try:
-            import shutil
-            
             # Copy JSON file
-            shutil.copy2(subject.filename, export_path)
+            if preserve_metadata:
+                shutil.copy2(subject.filename, export_path)
+            else:
+                shutil.copyfile(subject.filename, export_path)
             
             # Optionally copy images folder
             img_folder = os.path.join(IMAGES_FOLDER, subject.name)
@@ -248,45 +294,44 @@ class DataManager:
         Get statistics for a subject
         Returns: dict with various stats
         """
-        stats = {
-            'total_questions': len(subject.questions),
-            'total_lessons': len(subject.lessons),
-            'enabled_questions': sum(1 for q in subject.questions if getattr(q, 'enabled', True)),
-            'disabled_questions': sum(1 for q in subject.questions if not getattr(q, 'enabled', True)),
-            'enabled_lessons': sum(1 for l in subject.lessons if getattr(l, 'enabled', True)),
-            'disabled_lessons': sum(1 for l in subject.lessons if not getattr(l, 'enabled', True)),
-            'questions_by_type': {},
-            'questions_by_lesson': {},
-            'questions_with_images': 0,
-            'unassigned_questions': 0
-        }
+        enabled_questions = 0
+        questions_with_images = 0
+        by_type = {}
+        by_lesson_id = {}
         
-        # Count by type (only enabled)
+        # Single pass over questions (type/lesson/image counts are enabled only)
         for q in subject.questions:
-            if getattr(q, 'enabled', True):
-                qtype = q.type
-                stats['questions_by_type'][qtype] = stats['questions_by_type'].get(qtype, 0) + 1
+            if not q.enabled:
+                continue
+            enabled_questions += 1
+            by_type[q.type] = by_type.get(q.type, 0) + 1
+            by_lesson_id[q.lessonId] = by_lesson_id.get(q.lessonId, 0) + 1
+            if q.questionImage:
+                questions_with_images += 1
         
-        # Count by lesson (only enabled)
+        enabled_lessons = 0
+        by_lesson = {}
         for lesson in subject.lessons:
-            if getattr(lesson, 'enabled', True):
-                count = subject.get_enabled_questions_count(lesson.id)
+            if lesson.enabled:
+                enabled_lessons += 1
+                count = by_lesson_id.get(lesson.id, 0)
                 if count > 0:
-                    stats['questions_by_lesson'][lesson.name] = count
+                    by_lesson[lesson.name] = count
         
-        # Count unassigned (only enabled)
-        stats['unassigned_questions'] = sum(
-            1 for q in subject.get_questions_by_lesson(None) 
-            if getattr(q, 'enabled', True)
-        )
-        
-        # Count with images (only enabled)
-        stats['questions_with_images'] = sum(
-            1 for q in subject.questions 
-            if q.questionImage and getattr(q, 'enabled', True)
-        )
-        
-        return stats
+        total_questions = len(subject.questions)
+        total_lessons = len(subject.lessons)
+        return {
+            'total_questions': total_questions,
+            'total_lessons': total_lessons,
+            'enabled_questions': enabled_questions,
+            'disabled_questions': total_questions - enabled_questions,
+            'enabled_lessons': enabled_lessons,
+            'disabled_lessons': total_lessons - enabled_lessons,
+            'questions_by_type': by_type,
+            'questions_by_lesson': by_lesson,
+            'questions_with_images': questions_with_images,
+            'unassigned_questions': by_lesson_id.get(None, 0)
+        }
     
     @staticmethod
     def migrate_subject_to_latest(subject: Subject) -> bool:
@@ -3,12 +3,19 @@ Data Models for Quiz Application
 Version: 2.3 - Added enabled field for lessons and questions
 """
 
-from dataclasses import dataclass, field, asdict
-from typing import List, Dict, Optional, Any, Union
-from shared.constants import DEFAULT_IMAGE_SCALE, DEFAULT_LESSON_ID_PREFIX
+import sys
+from dataclasses import dataclass, field
+from operator import methodcaller
+from typing import List, Dict, Optional, Any, Tuple, Union, Callable, Iterator
+from shared.constants import DEFAULT_IMAGE_SCALE, DEFAULT_LESSON_ID_PREFIX, OTHERS_CATEGORY
 
 
-@dataclass
+def _intern_id(value):
+    """Intern an ID string read from JSON so equal lesson IDs share one object"""
+    return sys.intern(value) if type(value) is str else value
+
+
+@dataclass(slots=True)
 class Lesson:
     """Represents a lesson within a subject"""
     id: str
@@ -17,13 +24,13 @@ class Lesson:
     
     def to_dict(self) -> dict:
         """Convert to dictionary for JSON storage"""
-        return asdict(self)
+        return {'id': self.id, 'name': self.name, 'enabled': self.enabled}
     
     @classmethod
     def from_dict(cls, data: dict) -> 'Lesson':
         """Create from dictionary"""
         return cls(
-            id=data.get('id', ''),
+            id=_intern_id(data.get('id', '')),
             name=data.get('name', ''),
             enabled=data.get('enabled', True)  # NEW - Default to enabled
         )
@@ -33,7 +40,7 @@ class Lesson:
         return f"{self.name} ({self.id}) [{status}]"
 
 
-@dataclass
+@dataclass(slots=True)
 class Question:
     """Base question class"""
     id: int
@@ -44,10 +51,18 @@ class Question:
     questionImageScale: int = DEFAULT_IMAGE_SCALE
     
     def to_dict(self) -> dict:
-        """Convert to dictionary for JSON storage"""
-        data = asdict(self)
-        # Remove None values
-        return {k: v for k, v in data.items() if v is not None}
+        """
+        Convert to dictionary for JSON storage
+        Subclasses extend this with their own fields; None values are omitted
+        """
+        data = {'id': self.id, 'type': self.type}
+        if self.lessonId is not None:
+            data['lessonId'] = self.lessonId
+        data['enabled'] = self.enabled
+        if self.questionImage is not None:
+            data['questionImage'] = self.questionImage
+        data['questionImageScale'] = self.questionImageScale
+        return data
     
     @classmethod
     def from_dict(cls, data: dict) -> 'Question':
@@ -55,33 +70,22 @@ class Question:
         qtype = data.get('type', 'multiple_choice')
         
         # Route to appropriate subclass
-        if qtype == 'multiple_choice':
-            return MultipleChoiceQuestion.from_dict(data)
-        elif qtype == 'multiple_choice_multiple':
-            return MultipleChoiceMultipleQuestion.from_dict(data)
-        elif qtype == 'true_false':
-            return TrueFalseQuestion.from_dict(data)
-        elif qtype == 'fill_in_blank':
-            return FillInBlankQuestion.from_dict(data)
-        elif qtype == 'matching':
-            return MatchingQuestion.from_dict(data)
-        elif qtype == 'reordering':
-            return ReorderingQuestion.from_dict(data)
-        elif qtype == 'reading_comprehension':
-            return ReadingComprehensionQuestion.from_dict(data)
-        else:
-            # Generic question - create with explicit type
-            return Question(
-                id=data.get('id', 0),
-                type=qtype,
-                lessonId=data.get('lessonId'),
-                enabled=data.get('enabled', True),  # NEW
-                questionImage=data.get('questionImage'),
-                questionImageScale=data.get('questionImageScale', DEFAULT_IMAGE_SCALE)
-            )
+        subclass = _TYPE_TO_CLS.get(qtype)
+        if subclass is not None:
+            return subclass.from_dict(data)
+        
+        # Generic question - create with explicit type
+        return Question(
+            id=data.get('id', 0),
+            type=qtype,
+            lessonId=_intern_id(data.get('lessonId')),
+            enabled=data.get('enabled', True),  # NEW
+            questionImage=data.get('questionImage'),
+            questionImageScale=data.get('questionImageScale', DEFAULT_IMAGE_SCALE)
+        )
 
 
-@dataclass
+@dataclass(slots=True)
 class MultipleChoiceQuestion(Question):
     """Multiple choice question"""
     question: str = ""
@@ -94,24 +98,36 @@ class MultipleChoiceQuestion(Question):
         # Ensure type is set
         object.__setattr__(self, 'type', 'multiple_choice')
     
+    def to_dict(self) -> dict:
+        data = Question.to_dict(self)
+        data['question'] = self.question
+        data['options'] = self.options
+        data['correct'] = self.correct
+        if self.optionImages is not None:
+            data['optionImages'] = self.optionImages
+        data['optionImageScale'] = self.optionImageScale
+        return data
+    
     @classmethod
     def from_dict(cls, data: dict) -> 'MultipleChoiceQuestion':
-        return cls(
-            id=data.get('id', 0),
-            type='multiple_choice',
-            lessonId=data.get('lessonId'),
-            enabled=data.get('enabled', True),  # NEW
-            questionImage=data.get('questionImage'),
-            questionImageScale=data.get('questionImageScale', DEFAULT_IMAGE_SCALE),
-            question=data.get('question', ''),
-            options=data.get('options', []),
-            correct=data.get('correct', 0),
-            optionImages=data.get('optionImages'),
-            optionImageScale=data.get('optionImageScale', DEFAULT_IMAGE_SCALE)
-        )
+        # Assign slots directly, skipping __init__/__post_init__
+        obj = cls.__new__(cls)
+        g = data.get
+        obj.id = g('id', 0)
+        obj.type = 'multiple_choice'
+        obj.lessonId = _intern_id(g('lessonId'))
+        obj.enabled = g('enabled', True)  # NEW
+        obj.questionImage = g('questionImage')
+        obj.questionImageScale = g('questionImageScale', DEFAULT_IMAGE_SCALE)
+        obj.question = g('question', '')
+        obj.options = g('options', [])
+        obj.correct = g('correct', 0)
+        obj.optionImages = g('optionImages')
+        obj.optionImageScale = g('optionImageScale', DEFAULT_IMAGE_SCALE)
+        return obj
 
 
-@dataclass
+@dataclass(slots=True)
 class MultipleChoiceMultipleQuestion(Question):
     """Multiple choice question with multiple correct answers"""
     question: str = ""
@@ -124,24 +140,36 @@ class MultipleChoiceMultipleQuestion(Question):
         # Ensure type is set
         object.__setattr__(self, 'type', 'multiple_choice_multiple')
     
+    def to_dict(self) -> dict:
+        data = Question.to_dict(self)
+        data['question'] = self.question
+        data['options'] = self.options
+        data['correct'] = self.correct
+        if self.optionImages is not None:
+            data['optionImages'] = self.optionImages
+        data['optionImageScale'] = self.optionImageScale
+        return data
+    
     @classmethod
     def from_dict(cls, data: dict) -> 'MultipleChoiceMultipleQuestion':
-        return cls(
-            id=data.get('id', 0),
-            type='multiple_choice_multiple',
-            lessonId=data.get('lessonId'),
-            enabled=data.get('enabled', True),  # NEW
-            questionImage=data.get('questionImage'),
-            questionImageScale=data.get('questionImageScale', DEFAULT_IMAGE_SCALE),
-            question=data.get('question', ''),
-            options=data.get('options', []),
-            correct=data.get('correct', []),  # Load as list
-            optionImages=data.get('optionImages'),
-            optionImageScale=data.get('optionImageScale', DEFAULT_IMAGE_SCALE)
-        )
+        # Assign slots directly, skipping __init__/__post_init__
+        obj = cls.__new__(cls)
+        g = data.get
+        obj.id = g('id', 0)
+        obj.type = 'multiple_choice_multiple'
+        obj.lessonId = _intern_id(g('lessonId'))
+        obj.enabled = g('enabled', True)  # NEW
+        obj.questionImage = g('questionImage')
+        obj.questionImageScale = g('questionImageScale', DEFAULT_IMAGE_SCALE)
+        obj.question = g('question', '')
+        obj.options = g('options', [])
+        obj.correct = g('correct', [])  # Load as list
+        obj.optionImages = g('optionImages')
+        obj.optionImageScale = g('optionImageScale', DEFAULT_IMAGE_SCALE)
+        return obj
 
 
-@dataclass
+@dataclass(slots=True)
 class TrueFalseQuestion(Question):
     """True/False question"""
     question: str = ""
@@ -150,29 +178,45 @@ class TrueFalseQuestion(Question):
     def __post_init__(self):
         self.type = 'true_false'
     
+    def to_dict(self) -> dict:
+        data = Question.to_dict(self)
+        data['question'] = self.question
+        data['correct'] = self.correct
+        return data
+    
     @classmethod
     def from_dict(cls, data: dict) -> 'TrueFalseQuestion':
-        return cls(
-            id=data.get('id', 0),
-            type='true_false',
-            lessonId=data.get('lessonId'),
-            enabled=data.get('enabled', True),  # NEW
-            questionImage=data.get('questionImage'),
-            questionImageScale=data.get('questionImageScale', DEFAULT_IMAGE_SCALE),
-            question=data.get('question', ''),
-            correct=data.get('correct', 0)
-        )
+        # Assign slots directly, skipping __init__/__post_init__
+        obj = cls.__new__(cls)
+        g = data.get
+        obj.id = g('id', 0)
+        obj.type = 'true_false'
+        obj.lessonId = _intern_id(g('lessonId'))
+        obj.enabled = g('enabled', True)  # NEW
+        obj.questionImage = g('questionImage')
+        obj.questionImageScale = g('questionImageScale', DEFAULT_IMAGE_SCALE)
+        obj.question = g('question', '')
+        obj.correct = g('correct', 0)
+        return obj
 
 
-@dataclass
+@dataclass(slots=True)
 class FillInBlankQuestion(Question):
     """Fill in the blank question - supports single or multiple blanks"""
     question: str = ""
     correct: Union[List[str], Dict[str, List[str]]] = field(default_factory=list)
+    # Sorted blank IDs, computed on first get_blank_ids() call
+    _blank_ids_cache: Optional[Tuple[str, ...]] = field(default=None, init=False, repr=False, compare=False)
     
     def __post_init__(self):
         self.type = 'fill_in_blank'
     
+    def to_dict(self) -> dict:
+        data = Question.to_dict(self)
+        data['question'] = self.question
+        data['correct'] = self.correct
+        return data
+    
     def is_multi_blank(self) -> bool:
         """
         Check if this is a multi-blank question
@@ -189,17 +233,18 @@ class FillInBlankQuestion(Question):
             return len(self.correct)
         return 1
     
-    def get_blank_ids(self) -> List[str]:
+    def get_blank_ids(self) -> Tuple[str, ...]:
         """
-        Get list of blank IDs in order
-        Returns: ['Q1', 'Q2', ...] for multi-blank, ['Q1'] for single-blank
+        Get blank IDs in order
+        Returns: ('Q1', 'Q2', ...) for multi-blank, ('Q1',) for single-blank
         """
-        if self.is_multi_blank():
-            # Sort by numeric value: Q1, Q2, Q10 (not Q1, Q10, Q2)
-            blank_ids = list(self.correct.keys())
-            blank_ids.sort(key=lambda x: int(x.replace('Q', '')))
-            return blank_ids
-        return ['Q1']  # Single blank treated as Q1 for consistency
+        if self._blank_ids_cache is None:
+            if self.is_multi_blank():
+                # Sort by numeric value: Q1, Q2, Q10 (not Q1, Q10, Q2)
+                self._blank_ids_cache = tuple(sorted(self.correct, key=lambda x: int(x[1:])))
+            else:
+                self._blank_ids_cache = ('Q1',)  # Single blank treated as Q1 for consistency
+        return self._blank_ids_cache
     
     def get_acceptable_answers(self, blank_id: str) -> List[str]:
         """
@@ -219,18 +264,21 @@ class FillInBlankQuestion(Question):
         Create FillInBlankQuestion from dictionary
         Handles both old (list) and new (dict) formats
         """
-        return cls(
-            id=data.get('id', 0),
-            type='fill_in_blank',
-            lessonId=data.get('lessonId'),
-            enabled=data.get('enabled', True),
-            questionImage=data.get('questionImage'),
-            questionImageScale=data.get('questionImageScale', DEFAULT_IMAGE_SCALE),
-            question=data.get('question', ''),
-            correct=data.get('correct', [])  # Can be list or dict
-        )
+        # Assign slots directly, skipping __init__/__post_init__
+        obj = cls.__new__(cls)
+        g = data.get
+        obj.id = g('id', 0)
+        obj.type = 'fill_in_blank'
+        obj.lessonId = _intern_id(g('lessonId'))
+        obj.enabled = g('enabled', True)
+        obj.questionImage = g('questionImage')
+        obj.questionImageScale = g('questionImageScale', DEFAULT_IMAGE_SCALE)
+        obj.question = g('question', '')
+        obj.correct = g('correct', [])  # Can be list or dict
+        obj._blank_ids_cache = None
+        return obj
 
-@dataclass
+@dataclass(slots=True)
 class DropdownQuestion(Question):
     """Drop-down selection question - multiple dropdowns in text"""
     question: str = ""  # Text with [DD1], [DD2], etc. placeholders
@@ -243,6 +291,12 @@ class DropdownQuestion(Question):
     def __post_init__(self):
         self.type = 'dropdown'
     
+    def to_dict(self) -> dict:
+        data = Question.to_dict(self)
+        data['question'] = self.question
+        data['dropdowns'] = self.dropdowns
+        return data
+    
     def get_dropdown_count(self) -> int:
         """Get number of dropdowns in this question"""
         return len(self.dropdowns)
@@ -283,178 +337,215 @@ class DropdownQuestion(Question):
         """
         Create DropdownQuestion from dictionary
         """
-        return cls(
-            id=data.get('id', 0),
-            type='dropdown',
-            lessonId=data.get('lessonId'),
-            enabled=data.get('enabled', True),
-            questionImage=data.get('questionImage'),
-            questionImageScale=data.get('questionImageScale', DEFAULT_IMAGE_SCALE),
-            question=data.get('question', ''),
-            dropdowns=data.get('dropdowns', {})
-        )
-
-
-# IMPORTANT: Also update Question.from_dict() to route 'dropdown' type:
-
-"""
-Replace the Question.from_dict() method in shared/models.py with this corrected version:
-"""
-
-@classmethod
-def from_dict(cls, data: dict) -> 'Question':
-    """Create from dictionary - override in subclasses"""
-    qtype = data.get('type', 'multiple_choice')
-    
-    # Route to appropriate subclass
-    if qtype == 'multiple_choice':
-        return MultipleChoiceQuestion.from_dict(data)
-    elif qtype == 'multiple_choice_multiple':
-        return MultipleChoiceMultipleQuestion.from_dict(data)
-    elif qtype == 'true_false':
-        return TrueFalseQuestion.from_dict(data)
-    elif qtype == 'fill_in_blank':
-        return FillInBlankQuestion.from_dict(data)
-    elif qtype == 'dropdown':  # THIS WAS MISSING - ADD IT
-        return DropdownQuestion.from_dict(data)
-    elif qtype == 'matching':
-        return MatchingQuestion.from_dict(data)
-    elif qtype == 'reordering':
-        return ReorderingQuestion.from_dict(data)
-    elif qtype == 'reading_comprehension':
-        return ReadingComprehensionQuestion.from_dict(data)
-    else:
-        # Generic question - create with explicit type
-        return Question(
-            id=data.get('id', 0),
-            type=qtype,
-            lessonId=data.get('lessonId'),
-            enabled=data.get('enabled', True),
-            questionImage=data.get('questionImage'),
-            questionImageScale=data.get('questionImageScale', DEFAULT_IMAGE_SCALE)
-        )
-
-@dataclass
-class MatchingPair:
-    """A single matching pair"""
-    country: str
-    capital: str
-    id: str
-    
-    def to_dict(self) -> dict:
-        return asdict(self)
+        # Assign slots directly, skipping __init__/__post_init__
+        obj = cls.__new__(cls)
+        g = data.get
+        obj.id = g('id', 0)
+        obj.type = 'dropdown'
+        obj.lessonId = _intern_id(g('lessonId'))
+        obj.enabled = g('enabled', True)
+        obj.questionImage = g('questionImage')
+        obj.questionImageScale = g('questionImageScale', DEFAULT_IMAGE_SCALE)
+        obj.question = g('question', '')
+        obj.dropdowns = g('dropdowns', {})
+        return obj
 
 
-@dataclass
+@dataclass(slots=True)
 class MatchingQuestion(Question):
     """Matching question"""
     question: str = ""
-    pairs: List[Dict[str, str]] = field(default_factory=list)
+    pairs: List[Dict[str, str]] = field(default_factory=list)  # {country, capital, id}
     correct: Dict[str, str] = field(default_factory=dict)
     
     def __post_init__(self):
         self.type = 'matching'
     
+    def to_dict(self) -> dict:
+        data = Question.to_dict(self)
+        data['question'] = self.question
+        data['pairs'] = self.pairs
+        data['correct'] = self.correct
+        return data
+    
     @classmethod
     def from_dict(cls, data: dict) -> 'MatchingQuestion':
-        return cls(
-            id=data.get('id', 0),
-            type='matching',
-            lessonId=data.get('lessonId'),
-            enabled=data.get('enabled', True),  # NEW
-            questionImage=data.get('questionImage'),
-            questionImageScale=data.get('questionImageScale', DEFAULT_IMAGE_SCALE),
-            question=data.get('question', ''),
-            pairs=data.get('pairs', []),
-            correct=data.get('correct', {})
-        )
-
-
-@dataclass
-class ReorderingItem:
-    """A single item to reorder"""
-    text: str
-    order: int
-    
-    def to_dict(self) -> dict:
-        return asdict(self)
+        # Assign slots directly, skipping __init__/__post_init__
+        obj = cls.__new__(cls)
+        g = data.get
+        obj.id = g('id', 0)
+        obj.type = 'matching'
+        obj.lessonId = _intern_id(g('lessonId'))
+        obj.enabled = g('enabled', True)  # NEW
+        obj.questionImage = g('questionImage')
+        obj.questionImageScale = g('questionImageScale', DEFAULT_IMAGE_SCALE)
+        obj.question = g('question', '')
+        obj.pairs = g('pairs', [])
+        obj.correct = g('correct', {})
+        return obj
 
 
-@dataclass
+@dataclass(slots=True)
 class ReorderingQuestion(Question):
     """Reordering question"""
     question: str = ""
-    items: List[Dict[str, Any]] = field(default_factory=list)
+    items: List[Dict[str, Any]] = field(default_factory=list)  # {text, order}
     
     def __post_init__(self):
         self.type = 'reordering'
     
+    def to_dict(self) -> dict:
+        data = Question.to_dict(self)
+        data['question'] = self.question
+        data['items'] = self.items
+        return data
+    
     @classmethod
     def from_dict(cls, data: dict) -> 'ReorderingQuestion':
-        return cls(
-            id=data.get('id', 0),
-            type='reordering',
-            lessonId=data.get('lessonId'),
-            enabled=data.get('enabled', True),  # NEW
-            questionImage=data.get('questionImage'),
-            questionImageScale=data.get('questionImageScale', DEFAULT_IMAGE_SCALE),
-            question=data.get('question', ''),
-            items=data.get('items', [])
-        )
+        # Assign slots directly, skipping __init__/__post_init__
+        obj = cls.__new__(cls)
+        g = data.get
+        obj.id = g('id', 0)
+        obj.type = 'reordering'
+        obj.lessonId = _intern_id(g('lessonId'))
+        obj.enabled = g('enabled', True)  # NEW
+        obj.questionImage = g('questionImage')
+        obj.questionImageScale = g('questionImageScale', DEFAULT_IMAGE_SCALE)
+        obj.question = g('question', '')
+        obj.items = g('items', [])
+        return obj
 
 
-@dataclass
-class SubQuestion:
-    """Sub-question for reading comprehension"""
-    id: str
-    question: str
-    options: List[str]
-    correct: int
-    
-    def to_dict(self) -> dict:
-        return asdict(self)
-
-
-@dataclass
+@dataclass(slots=True)
 class ReadingComprehensionQuestion(Question):
     """Reading comprehension question"""
     passage: str = ""
     passageId: str = ""
-    questions: List[Dict[str, Any]] = field(default_factory=list)
+    questions: List[Dict[str, Any]] = field(default_factory=list)  # {id, question, options, correct}
     
     def __post_init__(self):
         self.type = 'reading_comprehension'
     
+    def to_dict(self) -> dict:
+        data = Question.to_dict(self)
+        data['passage'] = self.passage
+        data['passageId'] = self.passageId
+        data['questions'] = self.questions
+        return data
+    
     @classmethod
     def from_dict(cls, data: dict) -> 'ReadingComprehensionQuestion':
-        return cls(
-            id=data.get('id', 0),
-            type='reading_comprehension',
-            lessonId=data.get('lessonId'),
-            enabled=data.get('enabled', True),  # NEW
-            questionImage=data.get('questionImage'),
-            questionImageScale=data.get('questionImageScale', DEFAULT_IMAGE_SCALE),
-            passage=data.get('passage', ''),
-            passageId=data.get('passageId', ''),
-            questions=data.get('questions', [])
-        )
+        # Assign slots directly, skipping __init__/__post_init__
+        obj = cls.__new__(cls)
+        g = data.get
+        obj.id = g('id', 0)
+        obj.type = 'reading_comprehension'
+        obj.lessonId = _intern_id(g('lessonId'))
+        obj.enabled = g('enabled', True)  # NEW
+        obj.questionImage = g('questionImage')
+        obj.questionImageScale = g('questionImageScale', DEFAULT_IMAGE_SCALE)
+        obj.passage = g('passage', '')
+        obj.passageId = g('passageId', '')
+        obj.questions = g('questions', [])
+        return obj
+
+
+# Question.from_dict dispatch: JSON 'type' -> subclass
+_TYPE_TO_CLS: Dict[str, type] = {
+    'multiple_choice': MultipleChoiceQuestion,
+    'multiple_choice_multiple': MultipleChoiceMultipleQuestion,
+    'true_false': TrueFalseQuestion,
+    'fill_in_blank': FillInBlankQuestion,
+    'dropdown': DropdownQuestion,
+    'matching': MatchingQuestion,
+    'reordering': ReorderingQuestion,
+    'reading_comprehension': ReadingComprehensionQuestion,
+}
 
+_LESSON_PREFIX_LEN = len(DEFAULT_LESSON_ID_PREFIX)
+_to_dict = methodcaller('to_dict')
 
-@dataclass
+
+def _lesson_number(lesson_id: str) -> int:
+    """Numeric part of a generated lesson ID ('L007' -> 7), or 0 if it has none"""
+    if lesson_id.startswith(DEFAULT_LESSON_ID_PREFIX):
+        digits = lesson_id[_LESSON_PREFIX_LEN:]
+        if digits.isdecimal():
+            return int(digits)
+    return 0
+
+
+@dataclass(slots=True)
 class Subject:
     """Represents a subject with its lessons and questions"""
     name: str
     filename: str
     lessons: List[Lesson] = field(default_factory=list)
     questions: List[Question] = field(default_factory=list)
+    # Lookup indexes over lessons/questions, kept in sync by the mutation methods below
+    _l_by_id: Optional[Dict[str, Lesson]] = field(default=None, init=False, repr=False, compare=False)
+    _q_by_id: Optional[Dict[int, Question]] = field(default=None, init=False, repr=False, compare=False)
+    _q_by_lesson: Optional[Dict[Optional[str], List[Question]]] = field(default=None, init=False, repr=False, compare=False)
+    _max_qid: int = field(default=0, init=False, repr=False, compare=False)
+    _max_lesson_num: int = field(default=0, init=False, repr=False, compare=False)
+    # Memoized get_lesson_choices() result
+    _lesson_choices: Optional[Tuple[tuple, dict]] = field(default=None, init=False, repr=False, compare=False)
+    
+    def __post_init__(self):
+        self._build_indexes()
+    
+    def _build_indexes(self):
+        """Rebuild all lookup indexes from the lesson/question lists"""
+        # reversed() so the first of any duplicate ids wins, as with a linear scan
+        self._l_by_id = {l.id: l for l in reversed(self.lessons)}
+        self._q_by_id = {q.id: q for q in reversed(self.questions)}
+        self._max_qid = max(self._q_by_id, default=0)
+        self._max_lesson_num = max(map(_lesson_number, self._l_by_id), default=0)
+        self._index_by_lesson()
+    
+    def _index_by_lesson(self):
+        """Rebuild the lessonId -> questions index (preserves question order)"""
+        by_lesson = {}
+        for q in self.questions:
+            bucket = by_lesson.get(q.lessonId)
+            if bucket is None:
+                by_lesson[q.lessonId] = [q]
+            else:
+                bucket.append(q)
+        self._q_by_lesson = by_lesson
+    
+    def invalidate_lesson_choices(self):
+        """Drop the cached lesson choices (lessons may be renamed/reordered in place)"""
+        self._lesson_choices = None
     
     def to_dict(self) -> dict:
         """Convert to JSON structure"""
         return {
-            'lessons': [lesson.to_dict() for lesson in self.lessons],
-            'questions': [q.to_dict() for q in self.questions]
+            'lessons': list(map(Lesson.to_dict, self.lessons)),
+            # methodcaller dispatches to each subclass's own to_dict
+            'questions': list(map(_to_dict, self.questions))
         }
     
+    def iter_json_chunks(self, dumps: Callable[[dict], str]) -> Iterator[str]:
+        """
+        Yield the subject as JSON text, one lesson/question at a time
+        Output matches to_dict() dumped with indent=2; dumps must format a
+        single item the same way (e.g. json.dumps(item, indent=2))
+        """
+        for key, items, lead in (('lessons', self.lessons, '{\n'),
+                                 ('questions', self.questions, ',\n')):
+            yield f'{lead}  "{key}": '
+            if not items:
+                yield '[]'
+                continue
+            sep = '[\n'
+            for item in items:
+                # Re-indent the item to sit two levels deep
+                yield sep + '    ' + dumps(item.to_dict()).replace('\n', '\n    ')
+                sep = ',\n'
+            yield '\n  ]'
+        yield '\n}'
+    
     @classmethod
     def from_dict(cls, name: str, filename: str, data: dict) -> 'Subject':
         """Create from JSON data"""
@@ -470,67 +561,106 @@ class Subject:
     
     def get_lesson_by_id(self, lesson_id: str) -> Optional[Lesson]:
         """Find lesson by ID"""
-        return next((l for l in self.lessons if l.id == lesson_id), None)
+        return self._l_by_id.get(lesson_id)
+    
+    def get_lesson_index(self, lesson_id: str) -> Optional[int]:
+        """Position of a lesson in display order, or None if not found"""
+        lesson = self._l_by_id.get(lesson_id)
+        return self.lessons.index(lesson) if lesson is not None else None
+    
+    def get_lesson_choices(self) -> Tuple[tuple, dict]:
+        """
+        Lesson names for a selector, with Others first
+        Returns: (names, {name: lesson_id}) - cached, treat as read-only
+        """
+        if self._lesson_choices is None:
+            names = (OTHERS_CATEGORY,) + tuple(l.name for l in self.lessons)
+            ids = (None,) + tuple(l.id for l in self.lessons)
+            self._lesson_choices = (names, dict(zip(names, ids)))
+        return self._lesson_choices
     
     def get_question_by_id(self, question_id: int) -> Optional[Question]:
         """Find question by ID"""
-        return next((q for q in self.questions if q.id == question_id), None)
+        return self._q_by_id.get(question_id)
     
     def get_questions_by_lesson(self, lesson_id: Optional[str]) -> List[Question]:
-        """Get all questions for a lesson"""
-        return [q for q in self.questions if q.lessonId == lesson_id]
+        """
+        Get all questions for a lesson
+        Returns: the indexed list - treat as read-only
+        """
+        return self._q_by_lesson.get(lesson_id, [])
     
     def get_enabled_questions_count(self, lesson_id: Optional[str]) -> int:
         """Get count of enabled questions for a lesson"""
-        questions = self.get_questions_by_lesson(lesson_id)
-        return sum(1 for q in questions if getattr(q, 'enabled', True))
+        return sum(1 for q in self._q_by_lesson.get(lesson_id, ()) if q.enabled)
     
     def get_next_question_id(self) -> int:
-        """Get next available question ID"""
-        if not self.questions:
-            return 1
-        return max(q.id for q in self.questions) + 1
+        """Get next available question ID (IDs are not reused within a session)"""
+        return self._max_qid + 1
     
     def get_next_lesson_id(self) -> str:
-        """Get next available lesson ID"""
-        if not self.lessons:
-            return f"{DEFAULT_LESSON_ID_PREFIX}001"
-        
-        # Extract numbers from existing IDs
-        numbers = []
-        for lesson in self.lessons:
-            try:
-                num = int(lesson.id.replace(DEFAULT_LESSON_ID_PREFIX, ''))
-                numbers.append(num)
-            except:
-                pass
-        
-        next_num = max(numbers) + 1 if numbers else 1
+        """Get next available lesson ID (IDs are not reused within a session)"""
+        next_num = self._max_lesson_num + 1
         return f"{DEFAULT_LESSON_ID_PREFIX}{str(next_num).zfill(3)}"
     
     def add_lesson(self, lesson: Lesson):
         """Add a lesson"""
         self.lessons.append(lesson)
+        self._l_by_id.setdefault(lesson.id, lesson)
+        num = _lesson_number(lesson.id)
+        if num > self._max_lesson_num:
+            self._max_lesson_num = num
+        self.invalidate_lesson_choices()
     
     def remove_lesson(self, lesson_id: str):
         """Remove a lesson and unassign its questions"""
         self.lessons = [l for l in self.lessons if l.id != lesson_id]
+        self._l_by_id.pop(lesson_id, None)
         # Move questions to Others
-        for q in self.questions:
-            if q.lessonId == lesson_id:
+        moved = self._q_by_lesson.pop(lesson_id, None)
+        if moved:
+            for q in moved:
                 q.lessonId = None
+            self._q_by_lesson[None] = [q for q in self.questions if q.lessonId is None]
+        self.invalidate_lesson_choices()
     
     def add_question(self, question: Question):
         """Add a question"""
         self.questions.append(question)
+        self._q_by_id.setdefault(question.id, question)
+        self._q_by_lesson.setdefault(question.lessonId, []).append(question)
+        if question.id > self._max_qid:
+            self._max_qid = question.id
     
     def remove_question(self, question_id: int):
         """Remove a question"""
         self.questions = [q for q in self.questions if q.id != question_id]
+        removed = self._q_by_id.pop(question_id, None)
+        if removed is not None:
+            bucket = self._q_by_lesson.get(removed.lessonId, [])
+            self._q_by_lesson[removed.lessonId] = [q for q in bucket if q.id != question_id]
     
     def update_question(self, question_id: int, updated_question: Question):
         """Update a question"""
-        for i, q in enumerate(self.questions):
-            if q.id == question_id:
-                self.questions[i] = updated_question
-                break
\ No newline at end of file
+        old = self._q_by_id.get(question_id)
+        if old is None:
+            return
+        
+        self.questions[self.questions.index(old)] = updated_question
+        del self._q_by_id[question_id]
+        self._q_by_id[updated_question.id] = updated_question
+        
+        if updated_question.lessonId == old.lessonId:
+            bucket = self._q_by_lesson[old.lessonId]
+            bucket[bucket.index(old)] = updated_question
+        else:
+            # Lesson changed - drop from the old bucket, rebuild the new one in order
+            self._q_by_lesson[old.lessonId] = [q for q in self._q_by_lesson[old.lessonId] if q is not old]
+            lesson_id = updated_question.lessonId
+            self._q_by_lesson[lesson_id] = [q for q in self.questions if q.lessonId == lesson_id]
+    
+    def move_questions(self, questions: List[Question], lesson_id: Optional[str]):
+        """Reassign questions to a lesson (None = Others)"""
+        for q in questions:
+            q.lessonId = lesson_id
+        self._index_by_lesson()
\ No newline at end of file
@@ -3,16 +3,83 @@ Validation Functions
 Version: 2.2 - Added multiple_choice_multiple validation
 """
 
-from typing import Tuple, List, Dict, Any
+import re
+from typing import Tuple, List, Dict, Any, Optional, Container
 from shared.constants import (
     MIN_OPTIONS_MC,
     MIN_PAIRS_MATCHING,
     MIN_ITEMS_REORDERING,
     MIN_ANSWERS_FILL,
     MIN_SUBQUESTIONS_READING,
-    MIN_CORRECT_ANSWERS_MCM
+    MIN_CORRECT_ANSWERS_MCM,
+    MAX_BLANKS_FILL,
+    BLANK_PLACEHOLDER_PREFIX,
+    BLANK_PLACEHOLDER_SUFFIX,
+    MIN_DROPDOWNS, MAX_DROPDOWNS,
+    MIN_OPTIONS_PER_DROPDOWN, MAX_OPTIONS_PER_DROPDOWN,
+    DROPDOWN_PLACEHOLDER_PATTERN,
+    DROPDOWN_PLACEHOLDER_PREFIX,
+    DROPDOWN_PLACEHOLDER_SUFFIX
 )
 
+# Characters not allowed in subject names (they end up in file names)
+_INVALID_SUBJECT_CHARS_RE = re.compile(r'[/\\:*?"<>|]')
+
+# Placeholder patterns, compiled once
+_DROPDOWN_RE = re.compile(DROPDOWN_PLACEHOLDER_PATTERN)
+
+# Allowed true/false answers (0 = True, 1 = False)
+_TF_VALID = frozenset((0, 1))
+
+_BLANK_PREFIX_LEN = len(BLANK_PLACEHOLDER_PREFIX)
+_BLANK_SUFFIX_LEN = len(BLANK_PLACEHOLDER_SUFFIX)
+
+
+def _extract_blank_numbers(text: str) -> List[str]:
+    """
+    Find the numbers of all _Q1_, _Q2_ ... placeholders in text
+    Plain str.find scan, same matches as BLANK_PLACEHOLDER_PATTERN
+    Returns: list of number strings as written (e.g. '01'), in order of appearance
+    """
+    out = []
+    find = text.find
+    i = find(BLANK_PLACEHOLDER_PREFIX)
+    while i != -1:
+        start = i + _BLANK_PREFIX_LEN
+        j = find(BLANK_PLACEHOLDER_SUFFIX, start)
+        if j == -1:
+            break
+        num_str = text[start:j]
+        if num_str.isdecimal():
+            out.append(num_str)
+            i = find(BLANK_PLACEHOLDER_PREFIX, j + _BLANK_SUFFIX_LEN)
+        else:
+            # Not a placeholder here - retry from the next character
+            i = find(BLANK_PLACEHOLDER_PREFIX, i + 1)
+    return out
+
+
+def _first_empty(seq) -> int:
+    """
+    Find the first empty or whitespace-only string in seq
+    Returns: its index, or -1 if there is none
+    """
+    # Plain loop: cheaper than next() over a generator for short lists
+    for i, s in enumerate(seq):
+        if not (s and s.strip()):
+            return i
+    return -1
+
+
+def _req_text(text: str, what: str = "Question text") -> Tuple[bool, str]:
+    """
+    Check that a required text field is not blank
+    Returns: (is_valid, error_message)
+    """
+    if text and text.strip():
+        return True, ""
+    return False, f"{what} is required"
+
 
 class QuestionValidator:
     """Validates question data"""
@@ -24,19 +91,21 @@ class QuestionValidator:
         Validate multiple choice question
         Returns: (is_valid, error_message)
         """
-        if not question_text or not question_text.strip():
-            return False, "Question text is required"
+        ok, err = _req_text(question_text)
+        if not ok:
+            return ok, err
         
-        if len(options) < MIN_OPTIONS_MC:
+        n = len(options)
+        if n < MIN_OPTIONS_MC:
             return False, f"Need at least {MIN_OPTIONS_MC} options"
         
         # Check for empty options
-        for i, opt in enumerate(options):
-            if not opt or not opt.strip():
-                return False, f"Option {i} is empty"
+        bad = _first_empty(options)
+        if bad >= 0:
+            return False, f"Option {bad} is empty"
         
-        if correct_index < 0 or correct_index >= len(options):
-            return False, f"Correct index must be between 0 and {len(options)-1}"
+        if correct_index < 0 or correct_index >= n:
+            return False, f"Correct index must be between 0 and {n-1}"
         
         return True, ""
     
@@ -47,32 +116,34 @@ class QuestionValidator:
         Validate multiple choice question with multiple correct answers
         Returns: (is_valid, error_message)
         """
-        if not question_text or not question_text.strip():
-            return False, "Question text is required"
+        ok, err = _req_text(question_text)
+        if not ok:
+            return ok, err
         
-        if len(options) < MIN_OPTIONS_MC:
+        n = len(options)
+        if n < MIN_OPTIONS_MC:
             return False, f"Need at least {MIN_OPTIONS_MC} options"
         
         # Check for empty options
-        for i, opt in enumerate(options):
-            if not opt or not opt.strip():
-                return False, f"Option {i} is empty"
+        bad = _first_empty(options)
+        if bad >= 0:
+            return False, f"Option {bad} is empty"
         
         # Validate correct indices
         if not correct_indices or len(correct_indices) < MIN_CORRECT_ANSWERS_MCM:
             return False, f"Need at least {MIN_CORRECT_ANSWERS_MCM} correct answer"
         
-        if len(correct_indices) > len(options):
+        if len(correct_indices) > n:
             return False, "Too many correct answers"
         
-        # Check for duplicates
-        if len(correct_indices) != len(set(correct_indices)):
-            return False, "Duplicate correct answer indices found"
-        
-        # Check indices are in valid range
+        # Check indices are in valid range and not duplicated (one pass)
+        seen = set()
         for idx in correct_indices:
-            if idx < 0 or idx >= len(options):
-                return False, f"Correct index {idx} is out of range (0-{len(options)-1})"
+            if idx < 0 or idx >= n:
+                return False, f"Correct index {idx} is out of range (0-{n-1})"
+            if idx in seen:
+                return False, "Duplicate correct answer indices found"
+            seen.add(idx)
         
         return True, ""
     
@@ -82,10 +153,11 @@ class QuestionValidator:
         Validate true/false question
         Returns: (is_valid, error_message)
         """
-        if not question_text or not question_text.strip():
-            return False, "Question text is required"
+        ok, err = _req_text(question_text)
+        if not ok:
+            return ok, err
         
-        if correct not in [0, 1]:
+        if correct not in _TF_VALID:
             return False, "Correct answer must be 0 (True) or 1 (False)"
         
         return True, ""
@@ -97,8 +169,9 @@ class QuestionValidator:
         Supports both old (list) and new (dict) formats
         Returns: (is_valid, error_message)
         """
-        if not question_text or not question_text.strip():
-            return False, "Question text is required"
+        ok, err = _req_text(question_text)
+        if not ok:
+            return ok, err
         
         # Check format type
         is_multi_blank = isinstance(answers, dict)
@@ -125,79 +198,11 @@ class QuestionValidator:
             return False, f"Need at least {MIN_ANSWERS_FILL} acceptable answer"
         
         # Check for empty answers
-        for i, ans in enumerate(answers):
-            if not ans or not ans.strip():
-                return False, f"Answer {i+1} is empty"
+        bad = _first_empty(answers)
+        if bad >= 0:
+            return False, f"Answer {bad+1} is empty"
         
         return True, ""
-
-        @staticmethod
-        def _validate_multi_blank(question_text: str, answers: Dict[str, List[str]]) -> Tuple[bool, str]:
-            """
-            Validate multi-blank format (new format)
-            Args:
-                question_text: Question text with _Q1_, _Q2_ placeholders
-                answers: Dict mapping blank IDs to lists of acceptable answers
-            Returns: (is_valid, error_message)
-            """
-            import re
-            from shared.constants import (
-                MAX_BLANKS_FILL, 
-                BLANK_PLACEHOLDER_PATTERN,
-                BLANK_PLACEHOLDER_PREFIX,
-                BLANK_PLACEHOLDER_SUFFIX
-            )
-            
-            if not isinstance(answers, dict):
-                return False, "Answers must be a dictionary for multi-blank questions"
-            
-            if len(answers) == 0:
-                return False, "At least one blank is required"
-            
-            if len(answers) > MAX_BLANKS_FILL:
-                return False, f"Maximum {MAX_BLANKS_FILL} blanks allowed, found {len(answers)}"
-            
-            # Extract blank IDs from question text
-            placeholders_in_text = re.findall(BLANK_PLACEHOLDER_PATTERN, question_text)
-            placeholder_ids = [f'Q{num}' for num in placeholders_in_text]
-            
-            if len(placeholder_ids) == 0:
-                return False, f"No blanks found in question text. Use format: {BLANK_PLACEHOLDER_PREFIX}1{BLANK_PLACEHOLDER_SUFFIX}, {BLANK_PLACEHOLDER_PREFIX}2{BLANK_PLACEHOLDER_SUFFIX}, etc."
-            
-            # Get blank IDs from answers dict
-            answer_blank_ids = list(answers.keys())
-            
-            # Check if all placeholders in text have corresponding answers
-            for pid in placeholder_ids:
-                if pid not in answer_blank_ids:
-                    return False, f"Blank '{BLANK_PLACEHOLDER_PREFIX}{pid.replace('Q', '')}{BLANK_PLACEHOLDER_SUFFIX}' found in question text but no answers provided"
-            
-            # Check if all answers have corresponding placeholders in text
-            for aid in answer_blank_ids:
-                if aid not in placeholder_ids:
-                    return False, f"Answers provided for '{BLANK_PLACEHOLDER_PREFIX}{aid.replace('Q', '')}{BLANK_PLACEHOLDER_SUFFIX}' but blank not found in question text"
-            
-            # Validate consecutive numbering (Q1, Q2, Q3... no gaps)
-            blank_numbers = sorted([int(bid.replace('Q', '')) for bid in answer_blank_ids])
-            expected_numbers = list(range(1, len(blank_numbers) + 1))
-            
-            if blank_numbers != expected_numbers:
-                return False, f"Blank numbering must be consecutive starting from 1. Expected: Q{', Q'.join(map(str, expected_numbers))}, Found: Q{', Q'.join(map(str, blank_numbers))}"
-            
-            # Validate each blank's answers
-            for blank_id, acceptable_answers in answers.items():
-                if not isinstance(acceptable_answers, list):
-                    return False, f"Answers for {BLANK_PLACEHOLDER_PREFIX}{blank_id.replace('Q', '')}{BLANK_PLACEHOLDER_SUFFIX} must be a list"
-                
-                if len(acceptable_answers) < MIN_ANSWERS_FILL:
-                    return False, f"{BLANK_PLACEHOLDER_PREFIX}{blank_id.replace('Q', '')}{BLANK_PLACEHOLDER_SUFFIX} needs at least {MIN_ANSWERS_FILL} acceptable answer"
-                
-                # Check for empty answers
-                for i, ans in enumerate(acceptable_answers):
-                    if not ans or not ans.strip():
-                        return False, f"{BLANK_PLACEHOLDER_PREFIX}{blank_id.replace('Q', '')}{BLANK_PLACEHOLDER_SUFFIX} answer {i+1} is empty"
-            
-            return True, ""
     
     @staticmethod
     def _validate_multi_blank(question_text: str, answers: Dict[str, List[str]]) -> Tuple[bool, str]:
@@ -208,14 +213,6 @@ class QuestionValidator:
             answers: Dict mapping blank IDs to lists of acceptable answers
         Returns: (is_valid, error_message)
         """
-        import re
-        from shared.constants import (
-            MAX_BLANKS_FILL, 
-            BLANK_PLACEHOLDER_PATTERN,
-            BLANK_PLACEHOLDER_PREFIX,
-            BLANK_PLACEHOLDER_SUFFIX
-        )
-        
         if not isinstance(answers, dict):
             return False, "Answers must be a dictionary for multi-blank questions"
         
@@ -226,44 +223,56 @@ class QuestionValidator:
             return False, f"Maximum {MAX_BLANKS_FILL} blanks allowed, found {len(answers)}"
         
         # Extract blank IDs from question text
-        placeholders_in_text = re.findall(BLANK_PLACEHOLDER_PATTERN, question_text)
-        placeholder_ids = [f'Q{num}' for num in placeholders_in_text]
+        placeholder_numbers = _extract_blank_numbers(question_text)
+        placeholder_ids = [f'Q{num}' for num in placeholder_numbers]
         
         if len(placeholder_ids) == 0:
             return False, f"No blanks found in question text. Use format: {BLANK_PLACEHOLDER_PREFIX}1{BLANK_PLACEHOLDER_SUFFIX}, {BLANK_PLACEHOLDER_PREFIX}2{BLANK_PLACEHOLDER_SUFFIX}, etc."
         
-        # Get blank IDs from answers dict
-        answer_blank_ids = list(answers.keys())
+        # Cross-check placeholders in text against answer IDs
+        placeholder_set = set(placeholder_ids)
+        answer_set = set(answers)
         
         # Check if all placeholders in text have corresponding answers
-        for pid in placeholder_ids:
-            if pid not in answer_blank_ids:
-                return False, f"Blank '{BLANK_PLACEHOLDER_PREFIX}{pid.replace('Q', '')}{BLANK_PLACEHOLDER_SUFFIX}' found in question text but no answers provided"
+        missing_answers = placeholder_set - answer_set
+        if missing_answers:
+            # Report the first one in text order
+            num = next(n for n, pid in zip(placeholder_numbers, placeholder_ids) if pid in missing_answers)
+            return False, f"Blank '{BLANK_PLACEHOLDER_PREFIX}{num}{BLANK_PLACEHOLDER_SUFFIX}' found in question text but no answers provided"
         
         # Check if all answers have corresponding placeholders in text
-        for aid in answer_blank_ids:
-            if aid not in placeholder_ids:
-                return False, f"Answers provided for '{BLANK_PLACEHOLDER_PREFIX}{aid.replace('Q', '')}{BLANK_PLACEHOLDER_SUFFIX}' but blank not found in question text"
+        extra_answers = answer_set - placeholder_set
+        if extra_answers:
+            aid = next(a for a in answers if a in extra_answers)
+            return False, f"Answers provided for '{BLANK_PLACEHOLDER_PREFIX}{aid.replace('Q', '')}{BLANK_PLACEHOLDER_SUFFIX}' but blank not found in question text"
         
         # Validate consecutive numbering (Q1, Q2, Q3... no gaps)
-        blank_numbers = sorted([int(bid.replace('Q', '')) for bid in answer_blank_ids])
-        expected_numbers = list(range(1, len(blank_numbers) + 1))
-        
-        if blank_numbers != expected_numbers:
+        # Answer IDs match the placeholders exactly, so number the distinct IDs
+        # ('Q1' and 'Q01' are different IDs but the same number - not consecutive).
+        # n distinct ints spanning 1..n are exactly 1..n - no sort needed
+        numbers = [int(pid[1:]) for pid in placeholder_set]
+        n = len(numbers)
+        unique_numbers = set(numbers)
+        if len(unique_numbers) != n or min(unique_numbers) != 1 or max(unique_numbers) != n:
+            blank_numbers = sorted(numbers)
+            expected_numbers = range(1, n + 1)
             return False, f"Blank numbering must be consecutive starting from 1. Expected: Q{', Q'.join(map(str, expected_numbers))}, Found: Q{', Q'.join(map(str, blank_numbers))}"
         
         # Validate each blank's answers
         for blank_id, acceptable_answers in answers.items():
+            # IDs are 'Q' + digits here (checked against the text above)
+            label = f"{BLANK_PLACEHOLDER_PREFIX}{blank_id[1:]}{BLANK_PLACEHOLDER_SUFFIX}"
+            
             if not isinstance(acceptable_answers, list):
-                return False, f"Answers for {BLANK_PLACEHOLDER_PREFIX}{blank_id.replace('Q', '')}{BLANK_PLACEHOLDER_SUFFIX} must be a list"
+                return False, f"Answers for {label} must be a list"
             
             if len(acceptable_answers) < MIN_ANSWERS_FILL:
-                return False, f"{BLANK_PLACEHOLDER_PREFIX}{blank_id.replace('Q', '')}{BLANK_PLACEHOLDER_SUFFIX} needs at least {MIN_ANSWERS_FILL} acceptable answer"
+                return False, f"{label} needs at least {MIN_ANSWERS_FILL} acceptable answer"
             
             # Check for empty answers
-            for i, ans in enumerate(acceptable_answers):
-                if not ans or not ans.strip():
-                    return False, f"{BLANK_PLACEHOLDER_PREFIX}{blank_id.replace('Q', '')}{BLANK_PLACEHOLDER_SUFFIX} answer {i+1} is empty"
+            bad = _first_empty(acceptable_answers)
+            if bad >= 0:
+                return False, f"{label} answer {bad+1} is empty"
         
         return True, ""
     
@@ -273,17 +282,20 @@ class QuestionValidator:
         Validate matching question
         Returns: (is_valid, error_message)
         """
-        if not question_text or not question_text.strip():
-            return False, "Question text is required"
+        ok, err = _req_text(question_text)
+        if not ok:
+            return ok, err
         
         if len(pairs) < MIN_PAIRS_MATCHING:
             return False, f"Need at least {MIN_PAIRS_MATCHING} pairs"
         
         # Check each pair
         for i, pair in enumerate(pairs):
-            if not pair.get('country') or not pair.get('country').strip():
+            left = pair.get('country')
+            if not (left and left.strip()):
                 return False, f"Pair {i+1} left side is empty"
-            if not pair.get('capital') or not pair.get('capital').strip():
+            right = pair.get('capital')
+            if not (right and right.strip()):
                 return False, f"Pair {i+1} right side is empty"
             if not pair.get('id'):
                 return False, f"Pair {i+1} missing ID"
@@ -296,15 +308,17 @@ class QuestionValidator:
         Validate reordering question
         Returns: (is_valid, error_message)
         """
-        if not question_text or not question_text.strip():
-            return False, "Question text is required"
+        ok, err = _req_text(question_text)
+        if not ok:
+            return ok, err
         
         if len(items) < MIN_ITEMS_REORDERING:
             return False, f"Need at least {MIN_ITEMS_REORDERING} items"
         
         # Check each item
         for i, item in enumerate(items):
-            if not item.get('text') or not item.get('text').strip():
+            text = item.get('text')
+            if not (text and text.strip()):
                 return False, f"Item {i+1} text is empty"
             if 'order' not in item:
                 return False, f"Item {i+1} missing order"
@@ -318,27 +332,31 @@ class QuestionValidator:
         Validate reading comprehension question
         Returns: (is_valid, error_message)
         """
-        if not passage_text or not passage_text.strip():
-            return False, "Passage text is required"
+        ok, err = _req_text(passage_text, "Passage text")
+        if not ok:
+            return ok, err
         
         if len(sub_questions) < MIN_SUBQUESTIONS_READING:
             return False, f"Need at least {MIN_SUBQUESTIONS_READING} sub-question"
         
         # Check each sub-question
         for i, sq in enumerate(sub_questions):
-            if not sq.get('question') or not sq.get('question').strip():
+            sq_get = sq.get
+            text = sq_get('question')
+            if not (text and text.strip()):
                 return False, f"Sub-question {i+1} text is empty"
             
-            options = sq.get('options', [])
-            if len(options) < MIN_OPTIONS_MC:
+            options = sq_get('options', [])
+            n_options = len(options)
+            if n_options < MIN_OPTIONS_MC:
                 return False, f"Sub-question {i+1} needs at least {MIN_OPTIONS_MC} options"
             
-            for j, opt in enumerate(options):
-                if not opt or not opt.strip():
-                    return False, f"Sub-question {i+1}, option {j} is empty"
+            bad = _first_empty(options)
+            if bad >= 0:
+                return False, f"Sub-question {i+1}, option {bad} is empty"
             
-            correct = sq.get('correct')
-            if correct is None or correct < 0 or correct >= len(options):
+            correct = sq_get('correct')
+            if correct is None or not 0 <= correct < n_options:
                 return False, f"Sub-question {i+1} has invalid correct answer"
         
         return True, ""
@@ -348,23 +366,15 @@ class QuestionValidator:
         Validate dropdown question
         Returns: (is_valid, error_message)
         """
-        import re
-        from shared.constants import (
-            MIN_DROPDOWNS, MAX_DROPDOWNS,
-            MIN_OPTIONS_PER_DROPDOWN, MAX_OPTIONS_PER_DROPDOWN,
-            DROPDOWN_PLACEHOLDER_PATTERN,
-            DROPDOWN_PLACEHOLDER_PREFIX,
-            DROPDOWN_PLACEHOLDER_SUFFIX
-        )
-        
-        if not question_text or not question_text.strip():
-            return False, "Question text is required"
+        ok, err = _req_text(question_text)
+        if not ok:
+            return ok, err
         
         if not dropdowns or not isinstance(dropdowns, dict):
             return False, "Dropdowns data is required"
         
         # Extract placeholders from text
-        placeholders = re.findall(DROPDOWN_PLACEHOLDER_PATTERN, question_text)
+        placeholders = _DROPDOWN_RE.findall(question_text)
         placeholder_ids = [f'DD{num}' for num in placeholders]
         
         if len(placeholder_ids) < MIN_DROPDOWNS:
@@ -401,23 +411,24 @@ class QuestionValidator:
             if not isinstance(options, list):
                 return False, f"{DROPDOWN_PLACEHOLDER_PREFIX}{dd_id.replace('DD', '')}{DROPDOWN_PLACEHOLDER_SUFFIX}: options must be a list"
             
-            if len(options) < MIN_OPTIONS_PER_DROPDOWN:
-                return False, f"{DROPDOWN_PLACEHOLDER_PREFIX}{dd_id.replace('DD', '')}{DROPDOWN_PLACEHOLDER_SUFFIX}: need {MIN_OPTIONS_PER_DROPDOWN}-{MAX_OPTIONS_PER_DROPDOWN} options, found {len(options)}"
+            n_options = len(options)
+            if n_options < MIN_OPTIONS_PER_DROPDOWN:
+                return False, f"{DROPDOWN_PLACEHOLDER_PREFIX}{dd_id.replace('DD', '')}{DROPDOWN_PLACEHOLDER_SUFFIX}: need {MIN_OPTIONS_PER_DROPDOWN}-{MAX_OPTIONS_PER_DROPDOWN} options, found {n_options}"
             
-            if len(options) > MAX_OPTIONS_PER_DROPDOWN:
-                return False, f"{DROPDOWN_PLACEHOLDER_PREFIX}{dd_id.replace('DD', '')}{DROPDOWN_PLACEHOLDER_SUFFIX}: maximum {MAX_OPTIONS_PER_DROPDOWN} options allowed, found {len(options)}"
+            if n_options > MAX_OPTIONS_PER_DROPDOWN:
+                return False, f"{DROPDOWN_PLACEHOLDER_PREFIX}{dd_id.replace('DD', '')}{DROPDOWN_PLACEHOLDER_SUFFIX}: maximum {MAX_OPTIONS_PER_DROPDOWN} options allowed, found {n_options}"
             
             # Check for empty options
-            for i, opt in enumerate(options):
-                if not opt or not opt.strip():
-                    return False, f"{DROPDOWN_PLACEHOLDER_PREFIX}{dd_id.replace('DD', '')}{DROPDOWN_PLACEHOLDER_SUFFIX}: option {i+1} is empty"
+            bad = _first_empty(options)
+            if bad >= 0:
+                return False, f"{DROPDOWN_PLACEHOLDER_PREFIX}{dd_id.replace('DD', '')}{DROPDOWN_PLACEHOLDER_SUFFIX}: option {bad+1} is empty"
             
             # Validate correct index
             if correct is None or not isinstance(correct, int):
                 return False, f"{DROPDOWN_PLACEHOLDER_PREFIX}{dd_id.replace('DD', '')}{DROPDOWN_PLACEHOLDER_SUFFIX}: correct answer index required (must be integer)"
             
-            if correct < 0 or correct >= len(options):
-                return False, f"{DROPDOWN_PLACEHOLDER_PREFIX}{dd_id.replace('DD', '')}{DROPDOWN_PLACEHOLDER_SUFFIX}: correct index must be 0-{len(options)-1}, got {correct}"
+            if correct < 0 or correct >= n_options:
+                return False, f"{DROPDOWN_PLACEHOLDER_PREFIX}{dd_id.replace('DD', '')}{DROPDOWN_PLACEHOLDER_SUFFIX}: correct index must be 0-{n_options-1}, got {correct}"
         
         return True, ""
     
@@ -427,34 +438,38 @@ class QuestionValidator:
         Validate question based on type
         Returns: (is_valid, error_message)
         """
-        validators = {
-            'multiple_choice': QuestionValidator.validate_multiple_choice,
-            'multiple_choice_multiple': QuestionValidator.validate_multiple_choice_multiple,
-            'true_false': QuestionValidator.validate_true_false,
-            'fill_in_blank': QuestionValidator.validate_fill_in_blank,
-            'dropdown': QuestionValidator.validate_dropdown,  # NEW
-            'matching': QuestionValidator.validate_matching,
-            'reordering': QuestionValidator.validate_reordering,
-            'reading_comprehension': QuestionValidator.validate_reading_comprehension
-        }
-        
-        validator = validators.get(question_type)
-        if not validator:
+        validator = _VALIDATORS.get(question_type)
+        if validator is None:
             return False, f"Unknown question type: {question_type}"
         
         try:
             return validator(**kwargs)
-        except Exception as e:
+        except TypeError as e:
+            # Wrong keyword arguments for this question type
             return False, f"Validation error: {str(e)}"
 
 
+# validate_question_by_type dispatch (staticmethods resolve to plain functions)
+_VALIDATORS = {
+    'multiple_choice': QuestionValidator.validate_multiple_choice,
+    'multiple_choice_multiple': QuestionValidator.validate_multiple_choice_multiple,
+    'true_false': QuestionValidator.validate_true_false,
+    'fill_in_blank': QuestionValidator.validate_fill_in_blank,
+    'dropdown': QuestionValidator.validate_dropdown,
+    'matching': QuestionValidator.validate_matching,
+    'reordering': QuestionValidator.validate_reordering,
+    'reading_comprehension': QuestionValidator.validate_reading_comprehension
+}
+
+
 class LessonValidator:
     """Validates lesson data"""
     
     @staticmethod
-    def validate_lesson_name(name: str, existing_names: List[str] = None) -> Tuple[bool, str]:
+    def validate_lesson_name(name: str, existing_names: Optional[Container[str]] = None) -> Tuple[bool, str]:
         """
         Validate lesson name
+        existing_names: any container; pass a set when checking many names
         Returns: (is_valid, error_message)
         """
         if not name or not name.strip():
@@ -463,7 +478,7 @@ class LessonValidator:
         if len(name) > 100:
             return False, "Lesson name too long (max 100 characters)"
         
-        if existing_names and name in existing_names:
+        if existing_names is not None and name in existing_names:
             return False, "Lesson name already exists"
         
         return True, ""
@@ -496,10 +511,9 @@ class SubjectValidator:
             return False, "Subject name cannot be empty"
         
         # Check for invalid characters
-        invalid_chars = ['/', '\\', ':', '*', '?', '"', '<', '>', '|']
-        for char in invalid_chars:
-            if char in name:
-                return False, f"Subject name cannot contain '{char}'"
+        match = _INVALID_SUBJECT_CHARS_RE.search(name)
+        if match:
+            return False, f"Subject name cannot contain '{match.group()}'"
         
         if len(name) > 50:
             return False, "Subject name too long (max 50 characters)"
@@ -1,16 +1,18 @@
 """
 Image Helper Module for Quiz Admin Tool
 Handles image selection, validation, copying, and preview
-Version: 1.1 - Added delete_question_images function
+Version: 1.2 - JPEG previews decode at reduced scale
 Required: pip install Pillow
 """
 
 import os
 import shutil
 from tkinter import filedialog, messagebox
+from shared.constants import PREVIEW_RESAMPLE
 try:
     from PIL import Image, ImageTk
     PIL_AVAILABLE = True
+    _PREVIEW_FILTER = getattr(Image.Resampling, PREVIEW_RESAMPLE)
 except ImportError:
     PIL_AVAILABLE = False
 
@@ -229,8 +231,13 @@ def create_image_preview(image_path, max_width=400, scale_percent=50):
             new_width = max_width
             new_height = int(new_height * ratio)
         
+        # Let JPEGs decode at a reduced scale (still >= the target size)
+        # instead of decoding the full image only to shrink it
+        if 0 < new_width < width and 0 < new_height < height:
+            img.draft(None, (new_width, new_height))
+        
         # Resize
-        img_resized = img.resize((new_width, new_height), Image.Resampling.LANCZOS)
+        img_resized = img.resize((new_width, new_height), _PREVIEW_FILTER)
         
         # Convert to PhotoImage
         photo = ImageTk.PhotoImage(img_resized)